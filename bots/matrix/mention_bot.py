@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import io
 import json
 import logging
@@ -80,6 +81,21 @@ if not MATRIX_USER or not (MATRIX_PASSWORD or MATRIX_ACCESS_TOKEN):
     raise RuntimeError("Set MATRIX_USER and MATRIX_PASSWORD or MATRIX_ACCESS_TOKEN")
 
 
+@functools.lru_cache(maxsize=1)
+def _http() -> httpx.AsyncClient:
+    """Shared AsyncClient: keep-alive pooling amortizes TCP/TLS setup across
+    messages instead of paying a handshake per request."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+
+
+async def _close_http() -> None:
+    if _http.cache_info().currsize:
+        await _http().aclose()
+        _http.cache_clear()
+
+
 def _clean_reply(text: str) -> str:
     if not text: return ""
     # Strip <think> blocks
@@ -194,7 +210,10 @@ async def main() -> None:
     client.add_event_callback(message_cb, RoomMessageText)
     client.add_event_callback(lambda room, event: asyncio.create_task(audio_cb(room, event, client)), RoomMessageAudio)
 
-    await client.sync_forever(timeout=30000, full_state=True)
+    try:
+        await client.sync_forever(timeout=30000, full_state=True)
+    finally:
+        await _close_http()
 
 def gather_context(room: MatrixRoom, limit: int = 20) -> list[str]:
     timeline = getattr(room, "timeline", []) or []
@@ -209,20 +228,12 @@ async def call_sacred_brain(room_id: str, event: RoomMessageText, context: list[
     headers = {"Content-Type": "application/json"}
     if SACRED_BRAIN_API_KEY:
         headers["X-API-Key"] = SACRED_BRAIN_API_KEY
-    async with httpx.AsyncClient(timeout=SACRED_BRAIN_TIMEOUT) as client:
-        resp = await client.post(SACRED_BRAIN_URL, json=payload, headers=headers)
-        resp.raise_for_status()
-        data = resp.json()
-        return data.get("reply")
-
-    headers = {"Content-Type": "application/json"}
-    if SACRED_BRAIN_API_KEY:
-        headers["X-API-Key"] = SACRED_BRAIN_API_KEY
-    async with httpx.AsyncClient(timeout=SACRED_BRAIN_TIMEOUT) as client:
-        resp = await client.post(SACRED_BRAIN_URL, json=payload, headers=headers)
-        resp.raise_for_status()
-        data = resp.json()
-        return data.get("reply")
+    resp = await _http().post(
+        SACRED_BRAIN_URL, json=payload, headers=headers, timeout=SACRED_BRAIN_TIMEOUT
+    )
+    resp.raise_for_status()
+    data = resp.json()
+    return data.get("reply")
 
 
 
@@ -316,27 +327,26 @@ async def send_tts(text: str, room_id: str, client: AsyncClient, persona: str =
         if BAIBOT_API_KEY:
             headers["Authorization"] = f"Bearer {BAIBOT_API_KEY}"
             headers["X-API-Key"] = BAIBOT_API_KEY
-        async with httpx.AsyncClient(timeout=20.0) as http:
-            voice = BAIBOT_TTS_VOICE
-            if persona and persona.lower() in PERSONA_VOICE_MAP:
-                voice = PERSONA_VOICE_MAP[persona.lower()]
-
-            # Route to Edge TTS when using Neural voices
-            target_url = BAIBOT_TTS_URL
-            payload = {
-                "model": BAIBOT_TTS_MODEL,
-                "input": text,
-                "voice": voice,
-                "response_format": BAIBOT_TTS_FORMAT,
-            }
-            is_edge = "Neural" in str(voice)
-            if is_edge:
-                target_url = EDGE_TTS_URL
-                payload = {"input": text, "voice": voice}
-
-            resp = await http.post(target_url, headers=headers, json=payload)
-            resp.raise_for_status()
-            audio_bytes = resp.content
+        voice = BAIBOT_TTS_VOICE
+        if persona and persona.lower() in PERSONA_VOICE_MAP:
+            voice = PERSONA_VOICE_MAP[persona.lower()]
+
+        # Route to Edge TTS when using Neural voices
+        target_url = BAIBOT_TTS_URL
+        payload = {
+            "model": BAIBOT_TTS_MODEL,
+            "input": text,
+            "voice": voice,
+            "response_format": BAIBOT_TTS_FORMAT,
+        }
+        is_edge = "Neural" in str(voice)
+        if is_edge:
+            target_url = EDGE_TTS_URL
+            payload = {"input": text, "voice": voice}
+
+        resp = await _http().post(target_url, headers=headers, json=payload, timeout=20.0)
+        resp.raise_for_status()
+        audio_bytes = resp.content
         if not audio_bytes:
             return
         # Matrix requires upload to get an mxc URI.
@@ -388,10 +398,11 @@ async def audio_cb(room: MatrixRoom, event: RoomMessageAudio, client: AsyncClien
             headers["Authorization"] = f"Bearer {STT_API_KEY}"
         files = {"file": (filename, audio_bytes, mimetype or "application/octet-stream")}
         data = {"model": STT_MODEL}
-        async with httpx.AsyncClient(timeout=STT_TIMEOUT) as http:
-            resp = await http.post(STT_URL, headers=headers, data=data, files=files)
-            resp.raise_for_status()
-            result = resp.json()
+        resp = await _http().post(
+            STT_URL, headers=headers, data=data, files=files, timeout=STT_TIMEOUT
+        )
+        resp.raise_for_status()
+        result = resp.json()
         transcript = result.get("text") or result.get("transcription") or ""
         if not transcript:
             return
@@ -456,21 +467,20 @@ async def store_memory(user_id: str, text: str, room_id: str, auto: bool = False
         metadata["salience"] = "low"
         metadata.setdefault("relevance", "keep")
     payload = {"user_id": user_id, "text": text, "metadata": metadata}
-    async with httpx.AsyncClient(timeout=15) as client:
-        try:
-            resp = await client.post(url, json=payload, headers=headers)
-            resp.raise_for_status()
-            LOGGER.info(
-                "memory stored user=%s room=%s auto=%s status=%s",
-                user_id,
-                room_id,
-                auto,
-                resp.status_code,
-            )
-            return "Stored."
-        except Exception as exc:
-            LOGGER.warning("store_memory failed: %s", exc)
-            return "Error storing."
+    try:
+        resp = await _http().post(url, json=payload, headers=headers, timeout=15)
+        resp.raise_for_status()
+        LOGGER.info(
+            "memory stored user=%s room=%s auto=%s status=%s",
+            user_id,
+            room_id,
+            auto,
+            resp.status_code,
+        )
+        return "Stored."
+    except Exception as exc:
+        LOGGER.warning("store_memory failed: %s", exc)
+        return "Error storing."
 
 
 async def recall_memory(user_id: str, query: str) -> str:
@@ -479,22 +489,21 @@ async def recall_memory(user_id: str, query: str) -> str:
     if SACRED_BRAIN_API_KEY:
         headers["X-API-Key"] = SACRED_BRAIN_API_KEY
     params = {"query": query, "limit": 5}
-    async with httpx.AsyncClient(timeout=15) as client:
-        try:
-            resp = await client.get(url, params=params, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
-            memories = data.get("memories", [])
-            if not memories:
-                return "Nothing found."
-            lines = []
-            for mem in memories[:5]:
-                txt = mem.get("text", "")
-                lines.append(f"- {txt}")
-            return "Recap:\n" + "\n".join(lines)
-        except Exception as exc:
-            LOGGER.warning("recall_memory failed: %s", exc)
-            return "Error recalling."
+    try:
+        resp = await _http().get(url, params=params, headers=headers, timeout=15)
+        resp.raise_for_status()
+        data = resp.json()
+        memories = data.get("memories", [])
+        if not memories:
+            return "Nothing found."
+        lines = []
+        for mem in memories[:5]:
+            txt = mem.get("text", "")
+            lines.append(f"- {txt}")
+        return "Recap:\n" + "\n".join(lines)
+    except Exception as exc:
+        LOGGER.warning("recall_memory failed: %s", exc)
+        return "Error recalling."
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,37 @@
+"""Hippocampus package: lazy submodule access (PEP 562).
+
+Importing the package stays free of FastAPI/SQLite/msgspec costs until a
+submodule is actually touched, which keeps CLI and test processes that only
+need one piece from paying for the rest.
+"""
+from __future__ import annotations
+
+from importlib import import_module
+
+__all__ = [
+    "agno_integration",
+    "app",
+    "batching",
+    "bot_router",
+    "config",
+    "llm_cache",
+    "logging_config",
+    "mem0_adapter",
+    "models",
+    "reflection",
+    "summarizers",
+]
+
+_SUBMODULES = frozenset(__all__)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        module = import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES)
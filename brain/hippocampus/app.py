@@ -1,39 +1,65 @@
 """FastAPI app wiring for the hippocampus service."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import re
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import Depends, FastAPI, HTTPException, Query, Request, Security
+import httpx
+import msgspec
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, Response, Security
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import APIKeyHeader
 
 from sacred_brain.astrology import BirthInfo, compute_bias_note
 from sacred_brain.sam_pipeline import last_route_info
 
 from .agno_integration import build_agno_agent
+from .batching import AsyncBatcher
 from .bot_router import BotRouter
 from .config import AuthSettings, HippocampusSettings, load_settings
+from .llm_cache import SemanticCache
 from .logging_config import configure_logging
 from .mem0_adapter import Mem0Adapter
 from .models import (
     ExperienceCreate,
-    HealthResponse,
+    ExperienceCreateStruct,
     MatrixRelayRequest,
     MatrixRelayResponse,
+    MemoryBatchCreateResponse,
     MemoryCreateResponse,
     MemoryDeleteResponse,
     MemoryQueryResponse,
+    MemoryQueryResponseStruct,
+    MemoryRecordStruct,
     SummarizeRequest,
     SummaryResponse,
 )
-from .reflection import reflection_pass
+from .reflection import ELIGIBLE_MEMORY_FILTER, reflection_pass
 from .summarizers import SummarizerConfig
 from .summarizers import summarize_texts as summarize_via_llm
 
 LOGGER = logging.getLogger(__name__)
 
+_HEALTH_BYTES = b'{"status":"ok"}'
+
+# Replies shorter than this are acknowledgements or canned fallbacks; a
+# reflection pass on them costs a memory query without adding context.
+_REFLECTION_MIN_CHARS = 40
+
+
+class MsgspecResponse(Response):
+    """Response that serializes msgspec structs straight to JSON bytes."""
+
+    media_type = "application/json"
+
+    def render(self, content: object) -> bytes:
+        return msgspec.json.encode(content)
+
 
 
 def _build_auth_dependency(auth_settings: AuthSettings):
@@ -45,13 +71,59 @@ def _build_auth_dependency(auth_settings: AuthSettings):
 
     header_name = auth_settings.header_name or "X-API-Key"
     api_key_header = APIKeyHeader(name=header_name, auto_error=False)
+    keys = frozenset(auth_settings.api_keys)
 
     async def verify(api_key: str = Security(api_key_header)) -> None:
-        if not api_key or api_key not in auth_settings.api_keys:
+        if not api_key or api_key not in keys:
             raise HTTPException(status_code=401, detail="Invalid or missing API key")
 
+    verify.api_keys = keys  # type: ignore[attr-defined]
     return verify
 
+def _init_state(application: FastAPI, settings: HippocampusSettings, summarizer_config: SummarizerConfig) -> None:
+    """Build the heavyweight per-worker objects once and park them on app.state."""
+    if getattr(application.state, "mem0_adapter", None) is None:
+        application.state.mem0_adapter = Mem0Adapter(
+            enabled=settings.mem0.enabled,
+            api_key=settings.mem0.api_key,
+            backend=settings.mem0.backend,
+            backend_url=settings.mem0.backend_url,
+            summary_max_length=settings.mem0.summary_max_length,
+            default_query_limit=settings.mem0.query_limit,
+            persistence_path=settings.mem0.persistence_path,
+        )
+    if getattr(application.state, "agno_agent", None) is None:
+        application.state.agno_agent = build_agno_agent(
+            application.state.mem0_adapter, summarizer_config, settings.agno
+        )
+    if getattr(application.state, "sam_bias_note", None) is None:
+        application.state.sam_bias_note = compute_bias_note(
+            enabled=settings.sam_astrology.enabled,
+            birth=BirthInfo(
+                timestamp=settings.sam_birth.timestamp,
+                timezone=settings.sam_birth.timezone,
+                location_name=settings.sam_birth.location_name,
+                latitude=settings.sam_birth.latitude,
+                longitude=settings.sam_birth.longitude,
+            ),
+            cache_path=Path(settings.sam_astrology.cache_path),
+            engine=settings.sam_astrology.engine,
+            signals_enabled=settings.sam_astrology.signals_enabled,
+        )
+
+
+def _sse_event(event: str, payload: str) -> str:
+    """Frame a payload as one SSE event, one data: line per source line.
+
+    Interpolating the payload raw would let embedded newlines be parsed as
+    unknown SSE fields (silently dropped) and an embedded blank line end the
+    event early, truncating multi-paragraph replies; clients rejoin the data
+    lines with newlines per the spec.
+    """
+    data = "".join(f"data: {line}\n" for line in payload.splitlines()) or "data: \n"
+    return f"event: {event}\n{data}\n"
+
+
 def create_app(settings: HippocampusSettings | None = None) -> FastAPI:
     settings = settings or load_settings()
     configure_logging(settings)
@@ -59,16 +131,6 @@ def create_app(settings: HippocampusSettings | None = None) -> FastAPI:
     admin_users_env = os.getenv("SAM_ADMIN_USERS", "")
     admin_users = {u.strip() for u in admin_users_env.split(",") if u.strip()}
 
-    application = FastAPI(title="Sacred Brain – Hippocampus", version="0.1.0")
-    adapter = Mem0Adapter(
-        enabled=settings.mem0.enabled,
-        api_key=settings.mem0.api_key,
-        backend=settings.mem0.backend,
-        backend_url=settings.mem0.backend_url,
-        summary_max_length=settings.mem0.summary_max_length,
-        default_query_limit=settings.mem0.query_limit,
-        persistence_path=settings.mem0.persistence_path,
-    )
     summarizer_config = SummarizerConfig(
         enabled=settings.summarizer.enabled,
         provider=settings.summarizer.provider,
@@ -77,118 +139,218 @@ def create_app(settings: HippocampusSettings | None = None) -> FastAPI:
         api_key=settings.summarizer.api_key,
         max_tokens=settings.summarizer.max_tokens,
     )
-    agno_agent = build_agno_agent(adapter, summarizer_config, settings.agno)
 
-    application.add_middleware(
-        CORSMiddleware,
-        allow_origins=settings.app.allow_origins,
-        allow_methods=["*"],
-        allow_headers=["*"],
+    @asynccontextmanager
+    async def lifespan(application: FastAPI):
+        _init_state(application, settings, summarizer_config)
+        # One pooled client per worker for outbound probes run on worker
+        # threads (/doctor's LiteLLM check), so repeated polls reuse
+        # keep-alive connections instead of paying a TCP/TLS handshake each
+        # time. The summarizer path pools inside litellm itself.
+        application.state.http = httpx.Client(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        try:
+            yield
+        finally:
+            application.state.http.close()
+
+    application = FastAPI(
+        title="Sacred Brain – Hippocampus",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
+    # With a wildcard, keep Starlette's allow-all fast path; otherwise compile
+    # the origin list into a single anchored regex so per-request origin
+    # matching is one regex match instead of an O(N) list scan.
+    allow_origins = settings.app.allow_origins
+    if "*" in allow_origins or not allow_origins:
+        application.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"],
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+    else:
+        origin_regex = "^(" + "|".join(re.escape(origin) for origin in allow_origins) + ")$"
+        application.add_middleware(
+            CORSMiddleware,
+            allow_origin_regex=origin_regex,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
 
-    application.state.mem0_adapter = adapter
-    application.state.agno_agent = agno_agent
     application.state.settings = settings
-    application.state.sam_bias_note = compute_bias_note(
-        enabled=settings.sam_astrology.enabled,
-        birth=BirthInfo(
-            timestamp=settings.sam_birth.timestamp,
-            timezone=settings.sam_birth.timezone,
-            location_name=settings.sam_birth.location_name,
-            latitude=settings.sam_birth.latitude,
-            longitude=settings.sam_birth.longitude,
-        ),
-        cache_path=Path(settings.sam_astrology.cache_path),
-        engine=settings.sam_astrology.engine,
-        signals_enabled=settings.sam_astrology.signals_enabled,
-    )
+    # Placeholders so request-time reads are plain attribute loads instead of
+    # defensive getattr calls; the lifespan handler fills them in.
+    application.state.mem0_adapter = None
+    application.state.agno_agent = None
+    application.state.sam_bias_note = None
+    llm_cache = SemanticCache()
+    application.state.llm_cache = llm_cache
+
+    async def _run_summary_batch(batch: list[list[str]]) -> list[str]:
+        # The summarizer backend takes one text list per call, so a batch is
+        # dispatched as a single burst of threadpool calls rather than one
+        # wakeup per request.
+        return list(
+            await asyncio.gather(
+                *(asyncio.to_thread(summarize_via_llm, texts, summarizer_config) for texts in batch)
+            )
+        )
+
+    summary_batcher = AsyncBatcher(_run_summary_batch)
+    application.state.summary_batcher = summary_batcher
+
+    # Routers are immutable once built; reuse one per adapter/agent pair so
+    # the per-request work is a dict hit instead of object construction plus
+    # re-evaluated settings branches. Keyed by identity because tests swap
+    # app.state.mem0_adapter after create_app.
+    bot_routers: dict[tuple[int, int], BotRouter] = {}
+
+    def _get_bot_router(adapter: Mem0Adapter, agno_agent: object | None, bias_note: str) -> BotRouter:
+        key = (id(adapter), id(agno_agent))
+        bot_router = bot_routers.get(key)
+        if bot_router is None:
+            bot_router = BotRouter(
+                settings=settings,
+                adapter=adapter,
+                agno_agent=agno_agent,
+                summarizer_config=summarizer_config,
+                sam_bias_note=bias_note,
+            )
+            bot_routers[key] = bot_router
+        return bot_router
     auth_dependency = _build_auth_dependency(settings.auth)
+    application.state.auth_keys = getattr(auth_dependency, "api_keys", frozenset())
 
-    @application.get("/health", response_model=HealthResponse)
-    async def health() -> HealthResponse:
-        return HealthResponse(status="ok")
-
-    @application.post("/memories", response_model=MemoryCreateResponse)
-    async def create_memory(
-        experience: ExperienceCreate,
-        adapter: Mem0Adapter = Depends(get_adapter),
-        _: None = Depends(auth_dependency),
-    ) -> MemoryCreateResponse:
-        record = adapter.add_experience(experience)
+    @application.get("/health")
+    async def health() -> Response:
+        return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+    # One router-level auth dependency instead of a per-route Depends pair:
+    # the dependency solver runs once per request and the adapter comes
+    # straight off app.state.
+    router = APIRouter(dependencies=[Depends(auth_dependency)])
+
+    @router.post("/memories", response_model=MemoryCreateResponse)
+    async def create_memory(experience: ExperienceCreate, request: Request) -> MemoryCreateResponse:
+        adapter = request.app.state.mem0_adapter
+        record = await asyncio.to_thread(adapter.add_experience, experience)
         return MemoryCreateResponse(memory=record)
 
-    @application.delete("/memories/{memory_id}", response_model=MemoryDeleteResponse)
-    async def delete_memory(
-        memory_id: str,
-        adapter: Mem0Adapter = Depends(get_adapter),
-        _: None = Depends(auth_dependency),
-    ) -> MemoryDeleteResponse:
-        deleted = adapter.delete_memory(memory_id)
+    @router.post("/memories/batch", response_model=MemoryBatchCreateResponse)
+    async def create_memories_batch(request: Request) -> MemoryBatchCreateResponse:
+        # Bulk ingest skips per-item Pydantic model construction: msgspec
+        # decodes the whole body at C speed and the structs duck-type
+        # ExperienceCreate for the adapter.
+        try:
+            experiences = msgspec.json.decode(await request.body(), type=list[ExperienceCreateStruct])
+        except msgspec.ValidationError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+        if any(not exp.text for exp in experiences):
+            raise HTTPException(status_code=422, detail="text must be non-empty")
+        adapter = request.app.state.mem0_adapter
+        records = await asyncio.to_thread(adapter.add_experiences, experiences)
+        return MemoryBatchCreateResponse(memories=records)
+
+    @router.delete("/memories/{memory_id}", response_model=MemoryDeleteResponse)
+    async def delete_memory(memory_id: str, request: Request) -> MemoryDeleteResponse:
+        adapter = request.app.state.mem0_adapter
+        deleted = await asyncio.to_thread(adapter.delete_memory, memory_id)
         if not deleted:
             raise HTTPException(status_code=404, detail="Memory not found")
         return MemoryDeleteResponse(deleted=True)
 
-    @application.get("/memories/{user_id}", response_model=MemoryQueryResponse)
+    @router.get("/memories/{user_id}", response_model=MemoryQueryResponse)
     async def query_memories(
         user_id: str,
+        request: Request,
         query: str = Query(..., min_length=1),
         limit: int | None = Query(None, ge=1, le=100),
-        adapter: Mem0Adapter = Depends(get_adapter),
-        _: None = Depends(auth_dependency),
-    ) -> MemoryQueryResponse:
-        records = adapter.query_memories(user_id=user_id, query=query, limit=limit)
-        return MemoryQueryResponse(memories=records)
-
-    @application.post("/summaries", response_model=SummaryResponse)
-    async def summarize(
-        payload: SummarizeRequest,
-        adapter: Mem0Adapter = Depends(get_adapter),
-        _: None = Depends(auth_dependency),
-    ) -> SummaryResponse:
+    ) -> MsgspecResponse:
+        adapter = request.app.state.mem0_adapter
+        records = await asyncio.to_thread(adapter.query_memories, user_id=user_id, query=query, limit=limit)
+        payload = MemoryQueryResponseStruct(
+            memories=[
+                MemoryRecordStruct(
+                    id=record.id,
+                    user_id=record.user_id,
+                    text=record.text,
+                    metadata=record.metadata,
+                    score=record.score,
+                )
+                for record in records
+            ]
+        )
+        return MsgspecResponse(payload)
+
+    @router.post("/summaries", response_model=SummaryResponse)
+    async def summarize(payload: SummarizeRequest, request: Request) -> SummaryResponse:
+        adapter = request.app.state.mem0_adapter
         if summarizer_config.enabled:
-            summary = summarize_via_llm(payload.texts, summarizer_config)
+            summary = llm_cache.get(payload.texts)
+            if summary is None:
+                summary = await summary_batcher.enqueue(payload.texts)
+                llm_cache.put(payload.texts, summary)
         else:
-            summary = adapter.summarize_texts(payload.texts)
+            summary = await asyncio.to_thread(adapter.summarize_texts, payload.texts)
         if not summary:
             raise HTTPException(status_code=400, detail="No texts provided to summarize")
         return SummaryResponse(summary=summary)
 
-    @application.post("/matrix/respond", response_model=MatrixRelayResponse)
-    async def matrix_respond(
-        payload: MatrixRelayRequest,
-        request: Request,
-        adapter: Mem0Adapter = Depends(get_adapter),
-        _: None = Depends(auth_dependency),
-    ) -> MatrixRelayResponse:
-        agno_agent = getattr(request.app.state, "agno_agent", None)
-        bias_note = getattr(request.app.state, "sam_bias_note", "")
-
-        router = BotRouter(
-            settings=settings,
-            adapter=adapter,
-            agno_agent=agno_agent,
-            summarizer_config=summarizer_config,
-            sam_bias_note=bias_note,
-        )
-
-        reply = router.generate_response(
-            sender=payload.sender,
-            body=payload.body,
-            context=payload.context,
-            room_id=payload.room_id,
+    @router.post("/matrix/respond", response_model=MatrixRelayResponse)
+    async def matrix_respond(payload: MatrixRelayRequest, request: Request) -> MatrixRelayResponse:
+        adapter = request.app.state.mem0_adapter
+        agno_agent = request.app.state.agno_agent
+        bias_note = request.app.state.sam_bias_note or ""
+        router = _get_bot_router(adapter, agno_agent, bias_note)
+
+        # Replies draw on the sender's private memories, so the cache —
+        # including its similarity fallback — is scoped per sender.
+        cache_key = (payload.body, *payload.context)
+        cache_scope = f"matrix:{payload.sender}"
+        cached_reply = llm_cache.get(cache_key, scope=cache_scope)
+        if cached_reply is not None:
+            # Cached replies already went through reflection scoring when
+            # first generated; skip the extra memory round-trip.
+            return MatrixRelayResponse(reply=cached_reply)
+
+        # Prefetch reflection candidates concurrently with the reply so the
+        # per-request latency is max(reply, query) instead of their sum.
+        reply, reflection_candidates = await asyncio.gather(
+            asyncio.to_thread(
+                router.generate_response,
+                sender=payload.sender,
+                body=payload.body,
+                context=payload.context,
+                room_id=payload.room_id,
+            ),
+            asyncio.to_thread(
+                adapter.query_memories,
+                user_id=payload.sender,
+                query=payload.body,
+                limit=3,
+                metadata_filter=ELIGIBLE_MEMORY_FILTER,
+            ),
         )
 
-        if not reply:
+        if reply:
+            llm_cache.put(cache_key, reply, scope=cache_scope)
+        else:
             reply = "I'm having trouble thinking right now."
 
-        reflection = reflection_pass(
-            adapter=adapter,
-            user_id=payload.sender,
-            user_message=payload.body,
-            assistant_reply=reply,
-        )
-        if reflection:
-            reply = f"{reply}\n\n{reflection}"
+        if len(reply) >= _REFLECTION_MIN_CHARS:
+            reflection = reflection_pass(
+                adapter=adapter,
+                user_id=payload.sender,
+                user_message=payload.body,
+                assistant_reply=reply,
+                candidates=reflection_candidates or [],
+            )
+            if reflection:
+                reply = f"{reply}\n\n{reflection}"
 
         if payload.sender in admin_users:
             route_meta = last_route_info()
@@ -197,18 +359,65 @@ def create_app(settings: HippocampusSettings | None = None) -> FastAPI:
 
         return MatrixRelayResponse(reply=reply)
 
+    @router.post("/matrix/respond/stream")
+    async def matrix_respond_stream(payload: MatrixRelayRequest, request: Request) -> StreamingResponse:
+        """SSE variant of /matrix/respond: the reply is sent as soon as the
+        router produces it and the reflection follows as a second event, so
+        time-to-first-byte is not gated on the reflection pass."""
+        adapter = request.app.state.mem0_adapter
+        agno_agent = request.app.state.agno_agent
+        bias_note = request.app.state.sam_bias_note or ""
+        router = _get_bot_router(adapter, agno_agent, bias_note)
+
+        async def event_stream():
+            reply, reflection_candidates = await asyncio.gather(
+                asyncio.to_thread(
+                    router.generate_response,
+                    sender=payload.sender,
+                    body=payload.body,
+                    context=payload.context,
+                    room_id=payload.room_id,
+                ),
+                asyncio.to_thread(
+                    adapter.query_memories,
+                    user_id=payload.sender,
+                    query=payload.body,
+                    limit=3,
+                    metadata_filter=ELIGIBLE_MEMORY_FILTER,
+                ),
+            )
+            if not reply:
+                reply = "I'm having trouble thinking right now."
+            yield _sse_event("reply", reply)
+            reflection = await asyncio.to_thread(
+                reflection_pass,
+                adapter,
+                payload.sender,
+                payload.body,
+                reply,
+                3,
+                reflection_candidates or [],
+            )
+            if reflection:
+                yield _sse_event("reflection", reflection)
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
+
     @application.get("/doctor")
-    async def doctor() -> dict:
+    async def doctor(request: Request) -> dict:
         from sacred_brain.doctor import check_litellm
 
-        litellm_status = check_litellm()
+        litellm_status = await asyncio.to_thread(
+            check_litellm, client=getattr(request.app.state, "http", None)
+        )
         return {"litellm": litellm_status}
 
+    application.include_router(router)
     return application
 
 
-def get_adapter(request: Request) -> Mem0Adapter:
-    adapter = getattr(request.app.state, "mem0_adapter", None)
+async def get_adapter(request: Request) -> Mem0Adapter:
+    adapter = request.app.state.mem0_adapter
     if not adapter:
         raise RuntimeError("Mem0 adapter has not been initialised")
     return adapter
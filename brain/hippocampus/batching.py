@@ -0,0 +1,63 @@
+"""Micro-batching helper for LLM-backed endpoints.
+
+Concurrent callers enqueue work and share a single dispatch: the batcher
+collects jobs for a short window (or until the batch is full) and hands the
+whole batch to one runner call, so bursty traffic amortizes scheduling and
+connection overhead instead of dispatching one LLM call per request wakeup.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+BatchRunner = Callable[[list[Any]], Awaitable[list[Any]]]
+
+
+class AsyncBatcher:
+    """Collect concurrent jobs into windowed batches for a single runner call.
+
+    ``run_batch`` receives the list of enqueued payloads and must return one
+    result per payload, in order.
+    """
+
+    def __init__(self, run_batch: BatchRunner, max_batch: int = 32, window_seconds: float = 0.02):
+        self._run_batch = run_batch
+        self.max_batch = max_batch
+        self.window_seconds = window_seconds
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._flush_task: asyncio.Task | None = None
+
+    async def enqueue(self, payload: Any) -> Any:
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((payload, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush_now()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush_after_window())
+        return await future
+
+    def _flush_now(self) -> None:
+        batch, self._pending = self._pending, []
+        if batch:
+            asyncio.ensure_future(self._dispatch(batch))
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self.window_seconds)
+        self._flush_now()
+
+    async def _dispatch(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        payloads = [payload for payload, _ in batch]
+        try:
+            results = await self._run_batch(payloads)
+        except Exception as exc:  # propagate the failure to every waiter
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+
+__all__ = ["AsyncBatcher"]
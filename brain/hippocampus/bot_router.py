@@ -19,6 +19,14 @@ _DOC_CMD_RE = re.compile(
 )
 _DOC_NAME_RE = re.compile(r"^[A-Z0-9_\-]+$")
 
+_MATRIX_TEMPLATE = (
+    "You are responding to a Matrix mention. "
+    "Use the tools to fetch or store memories for this sender as needed. "
+    "Sender: {sender}\n"
+    "Message: {body}\n"
+    "Context:\n{context}"
+)
+
 
 def _docs_dir() -> Path:
     # Canonical Sacred Brain docs directory
@@ -59,6 +67,11 @@ class BotRouter:
         self.agno_agent = agno_agent
         self.summarizer_config = summarizer_config
         self.sam_bias_note = sam_bias_note
+        # Settings are fixed after startup; bind the dispatch decisions once
+        # instead of re-reading dotted settings attributes per request.
+        self._sam_enabled = settings.sam.enabled
+        self._agno_enabled = settings.agno.enabled and agno_agent is not None
+        self._bias_note = sam_bias_note if settings.sam_astrology.enabled else ""
 
     def generate_response(
         self,
@@ -96,19 +109,19 @@ class BotRouter:
                     "Summarize this document for a technical user in 8 bullet points. "
                     "Include 2 direct quotes (short lines) from the excerpt."
                 )
-            if self.settings.sam.enabled:
+            if self._sam_enabled:
                 return sam_generate_reply(
                     user_msg,
                     [],
                     SYSTEM_PROMPT + "\n\n" + doc_prompt,
                     memory_context_max=0,
-                    bias_note=self.sam_bias_note if self.settings.sam_astrology.enabled else "",
+                    bias_note=self._bias_note,
                 )
             # If Sam is disabled, just return the start of the doc.
             return doc_text[:2000]
 
         # 1. Sam (Astrology/LLM) Strategy
-        if self.settings.sam.enabled:
+        if self._sam_enabled:
             # Fetch memories relevant to the user's query
             mems = self.adapter.query_memories(
                 user_id=sender,
@@ -121,13 +134,13 @@ class BotRouter:
                 mems,
                 SYSTEM_PROMPT,
                 memory_context_max=self.settings.sam.memory_context_max,
-                bias_note=self.sam_bias_note if self.settings.sam_astrology.enabled else "",
+                bias_note=self._bias_note,
             )
             if reply:
                 return reply
 
         # 2. Agno Agent Strategy
-        if self.settings.agno.enabled and self.agno_agent:
+        if self._agno_enabled:
             prompt = self._format_matrix_prompt(sender, body, context)
             try:
                 # Agno agent .run() returns a RunResponse or similar object
@@ -151,11 +164,5 @@ class BotRouter:
         return reply if reply else "I need more context before I can help."
 
     def _format_matrix_prompt(self, sender: str, body: str, context: list[str]) -> str:
-        context_lines = "\n".join(f"- {line}" for line in context) if context else "No prior context."
-        return (
-            "You are responding to a Matrix mention. "
-            "Use the tools to fetch or store memories for this sender as needed. "
-            f"Sender: {sender}\n"
-            f"Message: {body}\n"
-            f"Context:\n{context_lines}"
-        )
+        context_lines = "- " + "\n- ".join(context) if context else "No prior context."
+        return _MATRIX_TEMPLATE.format(sender=sender, body=body, context=context_lines)
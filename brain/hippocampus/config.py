@@ -4,10 +4,11 @@ from __future__ import annotations
 import os
 import tomllib
 from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class AppSettings:
     host: str = "0.0.0.0"
     port: int = 54321
@@ -15,14 +16,14 @@ class AppSettings:
     allow_origins: list[str] = field(default_factory=lambda: ["*"])
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthSettings:
     enabled: bool = False
     header_name: str = "X-API-Key"
     api_keys: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SummarizerSettings:
     enabled: bool = False
     provider: str = "litellm"
@@ -32,7 +33,7 @@ class SummarizerSettings:
     max_tokens: int = 512
 
 
-@dataclass
+@dataclass(slots=True)
 class Mem0Settings:
     enabled: bool = True
     api_key: str | None = None
@@ -43,7 +44,7 @@ class Mem0Settings:
     persistence_path: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgnoSettings:
     enabled: bool = False
     model: str = "openai:gpt-4o-mini"
@@ -52,13 +53,13 @@ class AgnoSettings:
     system_prompt: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NotesSettings:
     notes_dir: str = "data/memories-denote"
     default_user: str = "default"
 
 
-@dataclass
+@dataclass(slots=True)
 class SamLLMSettings:
     enabled: bool = True
     base_url: str = "http://127.0.0.1:4000"
@@ -69,7 +70,7 @@ class SamLLMSettings:
     memory_candidates_max: int = 8
 
 
-@dataclass
+@dataclass(slots=True)
 class SamBirthSettings:
     timestamp: str = "2025-11-22T16:35:00"
     timezone: str = "Australia/Melbourne"
@@ -78,7 +79,7 @@ class SamBirthSettings:
     longitude: float = 144.9631
 
 
-@dataclass
+@dataclass(slots=True)
 class SamAstrologySettings:
     enabled: bool = False
     engine: str = "swisseph"
@@ -86,7 +87,7 @@ class SamAstrologySettings:
     cache_path: str = "var/cache/sam_chart.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class HippocampusSettings:
     app: AppSettings = field(default_factory=AppSettings)
     auth: AuthSettings = field(default_factory=AuthSettings)
@@ -99,8 +100,13 @@ class HippocampusSettings:
     sam_astrology: SamAstrologySettings = field(default_factory=SamAstrologySettings)
 
 
+@lru_cache(maxsize=8)
 def load_settings(config_path: str | Path | None = None) -> HippocampusSettings:
-    """Load settings from TOML + environment overrides."""
+    """Load settings from TOML + environment overrides.
+
+    Cached per config path; call ``load_settings.cache_clear()`` after
+    changing the environment (e.g. in tests) to force a reload.
+    """
     config_file = _resolve_config_path(config_path)
     file_data: dict[str, object] = {}
     if config_file and config_file.exists():
@@ -278,8 +284,8 @@ def _load_sam_astrology_settings(raw: object) -> SamAstrologySettings:
     )
 
 
-def _apply_env_overrides(settings: HippocampusSettings) -> HippocampusSettings:
-    env_map: dict[str, tuple[str, callable]] = {
+def _build_env_map() -> dict[str, tuple[str, callable]]:
+    return {
         "app.host": ("HIPPOCAMPUS_APP_HOST", str),
         "app.port": ("HIPPOCAMPUS_APP_PORT", int),
         "app.log_level": ("HIPPOCAMPUS_APP_LOG_LEVEL", str),
@@ -325,39 +331,39 @@ def _apply_env_overrides(settings: HippocampusSettings) -> HippocampusSettings:
         "sam_astrology.cache_path": ("SAM_ASTROLOGY_CACHE_PATH", str),
     }
 
-    updated = settings
-    for path, (env_var, caster) in env_map.items():
-        raw_value = os.getenv(env_var)
+
+def _apply_env_overrides(settings: HippocampusSettings) -> HippocampusSettings:
+    # Filter the environment in one pass against the known override keys,
+    # group by subtree, and apply a single dataclasses.replace per touched
+    # subtree instead of rebuilding the whole settings tree for each key.
+    present = {key: value for key, value in os.environ.items() if key in _ENV_KEYS}
+    if not present:
+        return settings
+    grouped: dict[str, dict[str, object]] = {}
+    for path, (env_var, caster) in _ENV_MAP.items():
+        raw_value = present.get(env_var)
         if raw_value is None:
             continue
-        value = caster(raw_value)
-        updated = _assign_path(updated, path, value)
-    return updated
-
-
-def _assign_path(settings: HippocampusSettings, path: str, value: object) -> HippocampusSettings:
-    top, _, attr = path.partition(".")
-    if top == "app":
-        return replace(settings, app=replace(settings.app, **{attr: value}))
-    if top == "auth":
-        if attr == "api_keys" and isinstance(value, list):
-            value = [str(item).strip() for item in value if str(item).strip()]
-        return replace(settings, auth=replace(settings.auth, **{attr: value}))
-    if top == "summarizer":
-        return replace(settings, summarizer=replace(settings.summarizer, **{attr: value}))
-    if top == "mem0":
-        return replace(settings, mem0=replace(settings.mem0, **{attr: value}))
-    if top == "agno":
-        return replace(settings, agno=replace(settings.agno, **{attr: value}))
-    if top == "notes":
-        return replace(settings, notes=replace(settings.notes, **{attr: value}))
-    if top == "sam":
-        return replace(settings, sam=replace(settings.sam, **{attr: value}))
-    if top == "sam_birth":
-        return replace(settings, sam_birth=replace(settings.sam_birth, **{attr: value}))
-    if top == "sam_astrology":
-        return replace(settings, sam_astrology=replace(settings.sam_astrology, **{attr: value}))
-    return settings
+        top, _, attr = path.partition(".")
+        grouped.setdefault(top, {})[attr] = caster(raw_value)
+    if not grouped:
+        return settings
+    return _apply_subtree_overrides(settings, grouped)
+
+
+def _apply_subtree_overrides(
+    settings: HippocampusSettings, grouped: dict[str, dict[str, object]]
+) -> HippocampusSettings:
+    auth_keys = grouped.get("auth", {}).get("api_keys")
+    if isinstance(auth_keys, list):
+        grouped["auth"]["api_keys"] = [str(item).strip() for item in auth_keys if str(item).strip()]
+    updated: dict[str, object] = {}
+    for top, values in grouped.items():
+        current = getattr(settings, top, None)
+        if current is None:
+            continue
+        updated[top] = replace(current, **values)
+    return replace(settings, **updated) if updated else settings
 
 
 def _csv_to_list(value: str) -> list[str]:
@@ -373,6 +379,10 @@ def _to_bool(value: str) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
+_ENV_MAP = _build_env_map()
+_ENV_KEYS = frozenset(env_var for env_var, _ in _ENV_MAP.values())
+
+
 __all__ = [
     "AppSettings",
     "AuthSettings",
@@ -0,0 +1,84 @@
+"""Semantic response cache for LLM-backed endpoints.
+
+Keeps a small LRU of recent prompt -> response pairs. Lookup first tries an
+exact hash of the canonicalized prompt, then falls back to token-set
+similarity against recent entries so near-duplicate prompts (re-sent Matrix
+context, retried summaries) skip the LLM round-trip entirely.
+
+Entries can carry a scope (e.g. the Matrix sender): the similarity fallback
+only matches entries with the same scope, so one user's personalized reply is
+never served to a near-identical prompt from another user. Unscoped callers
+(/summaries, which has no per-user context) share one fuzzy pool.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _canonicalize(texts: Iterable[str]) -> str:
+    return "\n".join(" ".join(text.split()).lower() for text in texts if text and text.strip())
+
+
+def _tokenize(text: str) -> frozenset[str]:
+    return frozenset(_TOKEN_RE.findall(text))
+
+
+def _similarity(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class SemanticCache:
+    """Bounded LRU + TTL cache keyed on canonicalized prompt text."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300.0, threshold: float = 0.92):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        # key -> (expiry, scope, token set, cached value)
+        self._entries: OrderedDict[str, tuple[float, str | None, frozenset[str], str]] = OrderedDict()
+
+    def get(self, texts: Iterable[str], scope: str | None = None) -> str | None:
+        canonical = _canonicalize(texts)
+        if not canonical:
+            return None
+        key = hashlib.sha256(f"{scope or ''}\x00{canonical}".encode()).hexdigest()
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None:
+            expiry, _, _, value = entry
+            if expiry > now:
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+        tokens = _tokenize(canonical)
+        for other_key, (expiry, other_scope, other_tokens, value) in self._entries.items():
+            if expiry <= now or other_scope != scope:
+                continue
+            if _similarity(tokens, other_tokens) >= self.threshold:
+                self._entries.move_to_end(other_key)
+                return value
+        return None
+
+    def put(self, texts: Iterable[str], value: str, scope: str | None = None) -> None:
+        canonical = _canonicalize(texts)
+        if not canonical or not value:
+            return
+        key = hashlib.sha256(f"{scope or ''}\x00{canonical}".encode()).hexdigest()
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, scope, _tokenize(canonical), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+__all__ = ["SemanticCache"]
@@ -1,21 +1,51 @@
 """Adapter that hides the specifics of the Mem0 client."""
 from __future__ import annotations
 
+import asyncio
+import atexit
+import hashlib
 import json
 import logging
+import os
+import queue
 import re
+import secrets
 import sqlite3
 import threading
-import uuid
-from collections.abc import Iterable
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
 from typing import Any
 
 from .models import ExperienceCreate, MemoryRecord
 
+try:
+    import orjson
+
+    # orjson emits bytes; SQLite binds them directly, so skip the decode.
+    _dumps_metadata = orjson.dumps
+    _loads_metadata = orjson.loads
+    _metadata_decode_errors = (orjson.JSONDecodeError, json.JSONDecodeError)
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+
+    def _dumps_metadata(metadata: dict[str, Any]) -> bytes:
+        return json.dumps(metadata).encode()
+
+    _loads_metadata = json.loads
+    _metadata_decode_errors = (json.JSONDecodeError,)
+
 LOGGER = logging.getLogger(__name__)
+# Bound once: token_hex skips UUID object construction and dash formatting,
+# and the module-level binding avoids an attribute lookup per insert.
+_new_id = secrets.token_hex
+
+_TOKEN_RE = re.compile(r"\w+")
 DEFAULT_PERSISTENCE_PATH = Path(__file__).resolve().parents[2] / "data" / "hippocampus_memories.sqlite"
 
 
@@ -29,8 +59,14 @@ class Mem0Adapter:
     default_query_limit: int = 5
     persistence_path: str | Path | None = None
     client: Any | None = None
+    query_cache_ttl: float = 60.0
+    query_cache_size: int = 1024
     fallback_client: Any = field(init=False, repr=False)
     plan: str | None = field(default=None, repr=False)
+    _query_cache: OrderedDict = field(init=False, repr=False)
+    _cache_lock: threading.RLock = field(init=False, repr=False)
+    _generations: dict[str, int] = field(init=False, repr=False)
+    _dispatch: dict[str, tuple[Any, Any]] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.fallback_client = InMemoryMem0Client(max_summary_chars=self.summary_max_length)
@@ -38,6 +74,28 @@ class Mem0Adapter:
             self.client = self._build_client()
         if self.plan is None:
             self.plan = self._build_adapter_plan()
+        # Recall cache: agent loops re-issue identical (user, query, limit)
+        # triples; keying on a per-user generation keeps hits correct across
+        # writes without scanning the cache to invalidate.
+        self._query_cache = OrderedDict()
+        self._cache_lock = threading.RLock()
+        self._generations = {}
+        # Bound methods resolved once per client pair; _invoke_with_fallback
+        # then does a single dict lookup instead of two getattrs per call.
+        self._dispatch = {
+            method_name: (
+                getattr(self.client, method_name, None),
+                getattr(self.fallback_client, method_name, None),
+            )
+            for method_name in (
+                "add_memory",
+                "add_memories",
+                "query_memories",
+                "list_memories",
+                "delete_memory",
+                "summarize",
+            )
+        }
 
     def _build_adapter_plan(self) -> str:
         """Describe the Mem0Adapter integration strategy for future work."""
@@ -65,6 +123,14 @@ class Mem0Adapter:
             LOGGER.info("Using SQLite persistence backend at %s", persistence_path)
             return self._build_sqlite_client(persistence_path)
 
+        if backend == "tiered":
+            persistence_path = self._resolve_persistence_path()
+            LOGGER.info("Using tiered backend (hot memory over SQLite at %s)", persistence_path)
+            return TieredMem0Client(
+                cold=self._build_sqlite_client(persistence_path),
+                max_summary_chars=self.summary_max_length,
+            )
+
         LOGGER.warning("Unknown backend %s; defaulting to in-memory", backend)
         return self.fallback_client
 
@@ -113,6 +179,10 @@ class Mem0Adapter:
                 LOGGER.warning("Invalid persistence path %s, using default", self.persistence_path)
         return DEFAULT_PERSISTENCE_PATH
 
+    def _bump_generation(self, user_id: str) -> None:
+        with self._cache_lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
     def add_experience(self, experience: ExperienceCreate) -> MemoryRecord:
         payload = self._invoke_with_fallback(
             "add_memory",
@@ -120,20 +190,86 @@ class Mem0Adapter:
             text=experience.text,
             metadata=experience.metadata,
         )
+        self._bump_generation(experience.user_id)
         return self._to_record(payload)
 
-    def query_memories(self, user_id: str, query: str, limit: int | None = None) -> list[MemoryRecord]:
-        result = self._invoke_with_fallback(
-            "query_memories",
-            user_id=user_id,
-            query=query,
-            limit=limit or self.default_query_limit,
+    def add_experiences(self, experiences: list[ExperienceCreate]) -> list[MemoryRecord]:
+        """Bulk variant of add_experience: one backend call, one transaction."""
+        if not experiences:
+            return []
+        items = [(exp.user_id, exp.text, exp.metadata) for exp in experiences]
+        payloads = self._invoke_with_fallback("add_memories", items=items)
+        for user_id in {exp.user_id for exp in experiences}:
+            self._bump_generation(user_id)
+        return [self._to_record(payload) for payload in payloads or []]
+
+    def query_memories(
+        self,
+        user_id: str,
+        query: str,
+        limit: int | None = None,
+        metadata_filter: dict[str, Any] | Iterable[dict[str, Any]] | None = None,
+    ) -> list[MemoryRecord]:
+        effective_limit = limit or self.default_query_limit
+        metadata_filter = _normalize_metadata_filter(metadata_filter)
+        filter_key = (
+            tuple(tuple(sorted(clause.items())) for clause in metadata_filter)
+            if metadata_filter
+            else None
         )
+        now = time.monotonic()
+        with self._cache_lock:
+            generation = self._generations.get(user_id, 0)
+            # Reflection passes whole conversations as the query; an 8-byte
+            # digest keeps cache keys small regardless of query length.
+            query_digest = hashlib.blake2b(query.lower().encode(), digest_size=8).digest()
+            key = (user_id, generation, query_digest, effective_limit, filter_key)
+            entry = self._query_cache.get(key)
+            if entry is not None:
+                expiry, records = entry
+                if expiry > now:
+                    self._query_cache.move_to_end(key)
+                    return list(records)
+                del self._query_cache[key]
+
+        kwargs: dict[str, Any] = {
+            "user_id": user_id,
+            "query": query,
+            "limit": effective_limit,
+        }
+        if metadata_filter:
+            # Forwarded only when set, so backends without the kwarg keep
+            # their unfiltered signature working.
+            kwargs["metadata_filter"] = metadata_filter
+        result = self._invoke_with_fallback("query_memories", **kwargs)
         records = []
         for item in result or []:
             records.append(self._to_record(item))
+
+        with self._cache_lock:
+            self._query_cache[key] = (now + self.query_cache_ttl, list(records))
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
         return records
 
+    async def query_memories_many_async(
+        self, queries: Iterable[tuple[str, str]], limit: int | None = None
+    ) -> list[list[MemoryRecord]]:
+        """Run several (user_id, query) lookups concurrently.
+
+        Each lookup goes through the sync query_memories on a worker thread —
+        keeping the cache, fallback, and record normalization — while gather
+        overlaps the blocking backend calls, so a multi-tenant fan-out costs
+        one round-trip of wall-clock instead of N.
+        """
+        return await asyncio.gather(
+            *(
+                asyncio.to_thread(self.query_memories, user_id, query, limit)
+                for user_id, query in queries
+            )
+        )
+
     def list_memories(self, user_id: str | None = None, limit: int | None = None) -> list[MemoryRecord]:
         result = self._invoke_with_fallback("list_memories", user_id=user_id, limit=limit)
         records: list[MemoryRecord] = []
@@ -143,6 +279,9 @@ class Mem0Adapter:
 
     def delete_memory(self, memory_id: str) -> bool:
         result = self._invoke_with_fallback("delete_memory", memory_id=memory_id)
+        # The owning user is unknown from the id alone, so drop the whole cache.
+        with self._cache_lock:
+            self._query_cache.clear()
         if isinstance(result, bool):
             return result
         if isinstance(result, dict):
@@ -156,11 +295,10 @@ class Mem0Adapter:
         summary = self._invoke_with_fallback("summarize", texts=texts, max_length=self.summary_max_length)
         if isinstance(summary, str):
             return summary
-        return _truncate(" ".join(texts), self.summary_max_length)
+        return _join_truncate(texts, self.summary_max_length)
 
     def _invoke_with_fallback(self, method_name: str, *args: Any, **kwargs: Any) -> Any:
-        primary = getattr(self.client, method_name, None)
-        fallback = getattr(self.fallback_client, method_name, None)
+        primary, fallback = self._dispatch[method_name]
         if not callable(primary):
             LOGGER.debug("Primary backend lacks %s; using fallback", method_name)
             if callable(fallback):
@@ -182,7 +320,9 @@ class Mem0Adapter:
     def _to_record(self, raw: dict[str, Any]) -> MemoryRecord:
         if not isinstance(raw, dict):
             raise TypeError("Mem0 client must return dictionaries")
-        record_id = raw.get("id") or raw.get("_id") or raw.get("memory_id") or str(uuid.uuid4())
+        record_id = raw.get("id") or raw.get("_id") or raw.get("memory_id")
+        if not record_id:
+            record_id = _new_id(16)
         metadata = raw.get("metadata") or {}
         if not isinstance(metadata, dict):
             metadata = {"value": metadata}
@@ -191,67 +331,407 @@ class Mem0Adapter:
             user_id=str(raw.get("user_id", "unknown")),
             text=str(raw.get("text", "")),
             metadata=metadata,
-            score=_maybe_float(raw.get("score")),
+            score=_maybe_float(raw["score"]) if "score" in raw else None,
         )
 
 
+# Metadata filters are a tuple of clause dicts, OR-ed together; keys within a
+# clause are AND-ed. Values compare by equality, except True/False which match
+# truthiness (so {"sensitive": False} also matches rows without the key).
+# Disjunction is needed because callers like reflection want
+# "kind in {thread, preference} OR sticky", which a flat dict cannot say.
+MetadataFilter = tuple[dict[str, Any], ...]
+
+
+def _normalize_metadata_filter(
+    metadata_filter: dict[str, Any] | Iterable[dict[str, Any]] | None,
+) -> MetadataFilter | None:
+    if metadata_filter is None:
+        return None
+    if isinstance(metadata_filter, dict):
+        return (metadata_filter,)
+    return tuple(metadata_filter)
+
+
+def _metadata_matches(metadata: dict[str, Any], metadata_filter: MetadataFilter) -> bool:
+    for clause in metadata_filter:
+        for key, expected in clause.items():
+            actual = metadata.get(key)
+            if expected is True:
+                if not actual:
+                    break
+            elif expected is False:
+                if actual:
+                    break
+            elif actual != expected:
+                break
+        else:
+            return True
+    return False
+
+
+def _metadata_filter_sql(metadata_filter: MetadataFilter, column: str = "metadata") -> tuple[str, list[Any]]:
+    """Render a metadata filter as a SQL predicate over the JSON column.
+
+    The CAST keeps json_extract working whether the column holds TEXT or the
+    orjson BLOB this module writes. Filter keys come from code, not users, so
+    interpolating them into the JSON path is safe.
+    """
+    disjuncts: list[str] = []
+    params: list[Any] = []
+    for clause in metadata_filter:
+        parts: list[str] = []
+        for key, expected in clause.items():
+            path = f"json_extract(CAST({column} AS TEXT), '$.{key}')"
+            if expected is True:
+                parts.append(f"COALESCE({path}, 0) != 0")
+            elif expected is False:
+                parts.append(f"COALESCE({path}, 0) = 0")
+            else:
+                parts.append(f"{path} = ?")
+                params.append(expected)
+        disjuncts.append("(" + " AND ".join(parts) + ")")
+    return "(" + " OR ".join(disjuncts) + ")", params
+
+
 @dataclass
 class InMemoryMem0Client:
+    """In-memory store laid out as parallel columns (structure-of-arrays).
+
+    One dict per record costs ~240B of dict overhead and two hash lookups per
+    row in the query loop; parallel lists keep the hot scan on primitive list
+    slots and only materialize a dict for actual hits.
+    """
+
     max_summary_chars: int = 480
-    _storage: list[dict[str, Any]] = field(default_factory=list)
+    max_per_user: int = 10_000
+    max_total: int = 200_000
+    _ids: list[str] = field(default_factory=list)
+    _user_ids: list[str] = field(default_factory=list)
+    _texts: list[str] = field(default_factory=list)
+    _texts_lower: list[str] = field(default_factory=list)
+    _metadata: list[dict[str, Any]] = field(default_factory=list)
+    _scores: list[float] = field(default_factory=list)
+    _by_user: dict[str, list[int]] = field(default_factory=dict)
+    # user_id -> token -> positions, maintained at insert time so queries can
+    # walk one posting list instead of substring-scanning the whole user slice.
+    _postings: dict[str, dict[str, list[int]]] = field(default_factory=dict)
+    # memory id -> slot, so delete is a dict pop instead of a column scan.
+    _index: dict[str, int] = field(default_factory=dict)
+    # Slots freed by delete, reused by the next insert; columns are only
+    # compacted once a quarter of the slots are dead.
+    _free: list[int] = field(default_factory=list)
 
-    def add_memory(self, user_id: str, text: str, metadata: dict[str, Any] | None = None) -> dict[str, Any]:
-        memory_id = str(uuid.uuid4())
-        payload = {
-            "id": memory_id,
-            "user_id": user_id,
-            "text": text,
-            "metadata": metadata or {},
-            "score": 1.0,
+    def _payload_at(self, index: int) -> dict[str, Any]:
+        return {
+            "id": self._ids[index],
+            "user_id": self._user_ids[index],
+            "text": self._texts[index],
+            "metadata": self._metadata[index],
+            "score": self._scores[index],
         }
-        self._storage.append(payload)
+
+    def add_memory(
+        self,
+        user_id: str,
+        text: str,
+        metadata: dict[str, Any] | None = None,
+        memory_id: str | None = None,
+    ) -> dict[str, Any]:
+        # memory_id lets a wrapping tier (TieredMem0Client) mirror a row under
+        # the id its persistent store already assigned.
+        memory_id = memory_id or _new_id(16)
+        if self._free:
+            position = self._free.pop()
+            self._ids[position] = memory_id
+            self._user_ids[position] = user_id
+            self._texts[position] = text
+            self._texts_lower[position] = text.lower()
+            self._metadata[position] = metadata or {}
+            self._scores[position] = 1.0
+        else:
+            self._ids.append(memory_id)
+            self._user_ids.append(user_id)
+            self._texts.append(text)
+            self._texts_lower.append(text.lower())
+            self._metadata.append(metadata or {})
+            self._scores.append(1.0)
+            position = len(self._ids) - 1
+        self._index[memory_id] = position
+        self._by_user.setdefault(user_id, []).append(position)
+        user_postings = self._postings.setdefault(user_id, {})
+        for token in set(_TOKEN_RE.findall(self._texts_lower[position])):
+            user_postings.setdefault(token, []).append(position)
+        payload = self._payload_at(position)
+        self._evict_overflow(user_id)
         return payload
 
-    def query_memories(self, user_id: str, query: str, limit: int = 5) -> list[dict[str, Any]]:
+    def add_memories(self, items: list[tuple[str, str, dict[str, Any] | None]]) -> list[dict[str, Any]]:
+        return [self.add_memory(user_id, text, metadata) for user_id, text, metadata in items]
+
+    def query_memories(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 5,
+        metadata_filter: MetadataFilter | None = None,
+    ) -> list[dict[str, Any]]:
         query_lower = query.lower()
-        matches = [
-            memo
-            for memo in self._storage
-            if memo["user_id"] == user_id and query_lower in memo["text"].lower()
-        ]
-        return matches[:limit]
+        tokens = _TOKEN_RE.findall(query_lower)
+        metadata_filter = _normalize_metadata_filter(metadata_filter)
+        if tokens:
+            # Walk the rarest token's posting list and confirm with the
+            # substring check. Returns only when the narrowed pass fills the
+            # limit; otherwise fall through to the full scan, since a query
+            # matching inside a word ("atch" in "batch") never appears as a
+            # whole-token posting. Same shape as the SQLite client's
+            # FTS-then-LIKE fallback.
+            user_postings = self._postings.get(user_id, {})
+            candidates = min(
+                (user_postings.get(token, ()) for token in tokens), key=len
+            )
+            matches = []
+            for index in candidates:
+                # Belt-and-braces against a stale posting entry whose slot was
+                # reused: never serve a row the posting's owner doesn't own.
+                if self._user_ids[index] != user_id:
+                    continue
+                if metadata_filter and not _metadata_matches(self._metadata[index], metadata_filter):
+                    continue
+                if query_lower in self._texts_lower[index]:
+                    matches.append(self._payload_at(index))
+                    if len(matches) >= limit:
+                        return matches
+        matches = []
+        for index in self._by_user.get(user_id, ()):
+            if metadata_filter and not _metadata_matches(self._metadata[index], metadata_filter):
+                continue
+            if query_lower in self._texts_lower[index]:
+                matches.append(self._payload_at(index))
+                if len(matches) >= limit:
+                    break
+        return matches
 
     def summarize(self, texts: list[str], max_length: int | None = None) -> str:
         max_chars = max_length or self.max_summary_chars
-        return _truncate(" ".join(texts), max_chars)
+        return _join_truncate(texts, max_chars)
 
     def delete_memory(self, memory_id: str) -> bool:
-        before = len(self._storage)
-        self._storage = [memo for memo in self._storage if memo["id"] != memory_id]
-        return len(self._storage) < before
+        index = self._index.pop(memory_id, None)
+        if index is None:
+            return False
+        user_id = self._user_ids[index]
+        user_positions = self._by_user.get(user_id)
+        if user_positions is not None:
+            user_positions.remove(index)
+        # Unlink the row's tokens too: a stale posting entry would otherwise
+        # keep pointing at the slot after the next insert reuses it, serving
+        # another row (possibly another user's) under this user's postings.
+        user_postings = self._postings.get(user_id)
+        if user_postings is not None:
+            for token in set(_TOKEN_RE.findall(self._texts_lower[index])):
+                positions = user_postings.get(token)
+                if positions is None:
+                    continue
+                positions.remove(index)
+                if not positions:
+                    del user_postings[token]
+        # Mask the slot rather than shifting every later index.
+        self._ids[index] = ""
+        self._user_ids[index] = ""
+        self._texts[index] = ""
+        self._texts_lower[index] = ""
+        self._metadata[index] = {}
+        self._free.append(index)
+        if len(self._free) * 4 > len(self._ids):
+            self._compact()
+        return True
+
+    def _compact(self) -> None:
+        keep = [position for position, memory_id in enumerate(self._ids) if memory_id]
+        for name in ("_ids", "_user_ids", "_texts", "_texts_lower", "_metadata", "_scores"):
+            column = getattr(self, name)
+            setattr(self, name, [column[position] for position in keep])
+        self._free.clear()
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        self._by_user = {}
+        self._postings = {}
+        self._index = {}
+        for position, uid in enumerate(self._user_ids):
+            if not uid:
+                continue  # masked slot awaiting compaction
+            self._index[self._ids[position]] = position
+            self._by_user.setdefault(uid, []).append(position)
+            user_postings = self._postings.setdefault(uid, {})
+            for token in set(_TOKEN_RE.findall(self._texts_lower[position])):
+                user_postings.setdefault(token, []).append(position)
+
+    def _evict_overflow(self, user_id: str) -> None:
+        """Drop oldest rows once the per-user or total cap is exceeded.
+
+        Evicts an extra eighth of the cap per pass so the O(N) column rebuild
+        amortizes to O(1) per insert once a long-running process hits steady
+        state, instead of compacting on every add.
+        """
+        drop: set[int] = set()
+        user_positions = self._by_user.get(user_id, ())
+        if len(user_positions) > self.max_per_user:
+            excess = len(user_positions) - self.max_per_user + self.max_per_user // 8
+            drop.update(user_positions[:excess])
+        if len(self._ids) > self.max_total:
+            # Low positions are the global oldest rows (approximately so once
+            # delete starts reusing slots; exact ordering is not worth an
+            # insertion counter for an emergency cap).
+            drop.update(range(len(self._ids) - self.max_total + self.max_total // 8))
+        if not drop:
+            return
+        keep = [i for i in range(len(self._ids)) if i not in drop and self._ids[i]]
+        for name in ("_ids", "_user_ids", "_texts", "_texts_lower", "_metadata", "_scores"):
+            column = getattr(self, name)
+            setattr(self, name, [column[i] for i in keep])
+        self._free.clear()
+        self._rebuild_indexes()
 
     def list_memories(self, user_id: str | None = None, limit: int | None = None) -> list[dict[str, Any]]:
-        memories = [memo for memo in self._storage if not user_id or memo["user_id"] == user_id]
-        return memories[:limit] if limit else list(memories)
+        if user_id:
+            memories = [self._payload_at(index) for index in self._by_user.get(user_id, ())]
+        else:
+            memories = [
+                self._payload_at(index) for index in range(len(self._ids)) if self._ids[index]
+            ]
+        return memories[:limit] if limit else memories
+
+
+# Fixed statement texts so every call hits the connection's prepared-statement
+# cache; dynamic WHERE/LIMIT concatenation would key a new plan per variant.
+_SQL_INSERT = (
+    "INSERT INTO memories (id, user_id, text, text_lower, metadata, score) VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_DELETE = "DELETE FROM memories WHERE id = ?"
+_SQL_FTS_QUERY = (
+    "SELECT m.id, m.user_id, m.text, m.metadata, m.score "
+    "FROM memories_fts f JOIN memories m ON m.rowid = f.rowid "
+    "WHERE f.user_id = ? AND memories_fts MATCH ? "
+    "ORDER BY f.rowid DESC LIMIT ?"
+)
+_SQL_LIST = "SELECT id, user_id, text, metadata, score FROM memories ORDER BY rowid DESC"
+_SQL_LIST_LIMIT = _SQL_LIST + " LIMIT ?"
+_SQL_LIST_USER = (
+    "SELECT id, user_id, text, metadata, score FROM memories WHERE user_id = ? ORDER BY rowid DESC"
+)
+_SQL_LIST_USER_LIMIT = _SQL_LIST_USER + " LIMIT ?"
 
 
 @dataclass
 class SQLiteMem0Client:
     db_path: str | Path
     max_summary_chars: int = 480
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    read_pool_size: int | None = None
+    maintenance_interval: float = 60.0
+    embedding_dim: int = 384
     _conn: sqlite3.Connection = field(init=False, repr=False)
     _lock: threading.Lock = field(init=False, repr=False)
+    _read_pool: queue.Queue = field(init=False, repr=False)
+    _maintenance_timer: threading.Timer | None = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.db_path = Path(self.db_path).expanduser()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
-        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        self._conn.row_factory = sqlite3.Row
+        # isolation_level=None puts the connection in autocommit so we control
+        # transactions explicitly; a bigger statement cache keeps the hot
+        # INSERT/DELETE literals prepared across calls.
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=256,
+            isolation_level=None,
+        )
+        self._apply_pragmas(self._conn)
         self._init_schema()
+        # WAL permits N readers alongside the single writer, so reads go
+        # through a pool of read-only connections instead of the write lock.
+        pool_size = self.read_pool_size or os.cpu_count() or 2
+        self._read_pool = queue.Queue(maxsize=pool_size)
+        # Long-lived connections can starve WAL checkpoints, letting the -wal
+        # file grow without bound; a daemon timer truncates it periodically
+        # and atexit takes a final pass for short-lived processes.
+        self._maintenance_timer = None
+        if self.maintenance_interval > 0:
+            self._schedule_maintenance()
+        atexit.register(self.close)
+
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        # WAL lets readers run concurrently with the single writer and
+        # synchronous=NORMAL drops the per-commit fsync that dominates
+        # append-heavy workloads on the default DELETE journal.
+        conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA busy_timeout=5000")
+
+    def _open_read_conn(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+        )
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _checkout_read(self) -> sqlite3.Connection:
+        try:
+            return self._read_pool.get_nowait()
+        except queue.Empty:
+            return self._open_read_conn()
+
+    def _checkin_read(self, conn: sqlite3.Connection) -> None:
+        try:
+            self._read_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _schedule_maintenance(self) -> None:
+        timer = threading.Timer(self.maintenance_interval, self._run_maintenance)
+        timer.daemon = True
+        timer.start()
+        self._maintenance_timer = timer
+
+    def _run_maintenance(self) -> None:
+        try:
+            self.maintenance()
+        except sqlite3.Error:
+            LOGGER.debug("WAL maintenance pass failed", exc_info=True)
+        if getattr(self, "_conn", None) is not None:
+            self._schedule_maintenance()
+
+    def maintenance(self) -> None:
+        """Truncate the WAL so disk use and read latency stay bounded."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    @contextmanager
+    def _write_tx(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
 
     def _init_schema(self) -> None:
-        with self._conn:
+        with self._write_tx():
             self._conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS memories (
@@ -264,10 +744,95 @@ class SQLiteMem0Client:
                 )
                 """
             )
+            # The user_id index entries end with the rowid, so a reverse scan
+            # already streams "last N for user" in rowid DESC order without a
+            # temp sort B-tree; rowid itself cannot be named in an index.
             self._conn.execute("CREATE INDEX IF NOT EXISTS idx_memories_user ON memories(user_id)")
+        self._migrate_text_lower()
+        self._init_fts()
+        self._init_vec()
+        self._conn.execute("ANALYZE")
 
-    def add_memory(self, user_id: str, text: str, metadata: dict[str, Any] | None = None) -> dict[str, Any]:
-        memory_id = str(uuid.uuid4())
+    def _migrate_text_lower(self) -> None:
+        # Stored lowercase column: LOWER(text) in the LIKE fallback re-lowered
+        # every row on every query and defeated index use.
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(memories)")}
+        with self._write_tx():
+            if "text_lower" not in columns:
+                self._conn.execute("ALTER TABLE memories ADD COLUMN text_lower TEXT")
+            self._conn.execute("UPDATE memories SET text_lower = LOWER(text) WHERE text_lower IS NULL")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_memories_user_textlower ON memories(user_id, text_lower)"
+            )
+
+    def _init_fts(self) -> None:
+        """Mirror `text` into an FTS5 table so queries use MATCH, not LIKE scans."""
+        try:
+            exists = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='memories_fts'"
+            ).fetchone()
+            with self._write_tx():
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5("
+                    "text, user_id UNINDEXED, content='memories', content_rowid='rowid', "
+                    "tokenize='unicode61 remove_diacritics 2')"
+                )
+                self._conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS memories_fts_ai AFTER INSERT ON memories BEGIN "
+                    "INSERT INTO memories_fts(rowid, text, user_id) "
+                    "VALUES (new.rowid, new.text, new.user_id); END"
+                )
+                self._conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS memories_fts_ad AFTER DELETE ON memories BEGIN "
+                    "INSERT INTO memories_fts(memories_fts, rowid, text, user_id) "
+                    "VALUES ('delete', old.rowid, old.text, old.user_id); END"
+                )
+                self._conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS memories_fts_au AFTER UPDATE ON memories BEGIN "
+                    "INSERT INTO memories_fts(memories_fts, rowid, text, user_id) "
+                    "VALUES ('delete', old.rowid, old.text, old.user_id); "
+                    "INSERT INTO memories_fts(rowid, text, user_id) "
+                    "VALUES (new.rowid, new.text, new.user_id); END"
+                )
+                if not exists:
+                    # Index any rows written before the FTS table existed.
+                    self._conn.execute("INSERT INTO memories_fts(memories_fts) VALUES('rebuild')")
+            self._fts_enabled = True
+        except sqlite3.OperationalError as exc:
+            LOGGER.warning("FTS5 unavailable; falling back to LIKE scans: %s", exc)
+            self._fts_enabled = False
+
+    def _init_vec(self) -> None:
+        """Optional sqlite-vec tier for KNN recall over precomputed embeddings.
+
+        Only activates when the vec0 extension is loadable; callers must supply
+        embeddings — this module never computes them. Everything else keeps
+        working on FTS/LIKE when the extension is absent.
+        """
+        try:
+            self._conn.enable_load_extension(True)
+            try:
+                self._conn.load_extension("vec0")
+            finally:
+                self._conn.enable_load_extension(False)
+            with self._write_tx():
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS memory_vecs USING vec0("
+                    f"embedding float[{self.embedding_dim}])"
+                )
+            self._vec_enabled = True
+        except (sqlite3.OperationalError, AttributeError) as exc:
+            LOGGER.debug("sqlite-vec unavailable; vector recall disabled: %s", exc)
+            self._vec_enabled = False
+
+    def add_memory(
+        self,
+        user_id: str,
+        text: str,
+        metadata: dict[str, Any] | None = None,
+        embedding: list[float] | None = None,
+    ) -> dict[str, Any]:
+        memory_id = _new_id(16)
         payload = {
             "id": memory_id,
             "user_id": user_id,
@@ -275,26 +840,141 @@ class SQLiteMem0Client:
             "metadata": metadata or {},
             "score": 1.0,
         }
-        metadata_json = json.dumps(payload["metadata"])
-        with self._lock, self._conn:
-            self._conn.execute(
-                "INSERT INTO memories (id, user_id, text, metadata, score) VALUES (?, ?, ?, ?, ?)",
-                (memory_id, user_id, text, metadata_json, payload["score"]),
+        metadata_json = _dumps_metadata(payload["metadata"])
+        with self._write_tx():
+            cur = self._conn.execute(
+                _SQL_INSERT,
+                (memory_id, user_id, text, text.lower(), metadata_json, payload["score"]),
             )
+            if self._vec_enabled and embedding is not None:
+                self._conn.execute(
+                    "INSERT INTO memory_vecs (rowid, embedding) VALUES (?, ?)",
+                    (cur.lastrowid, json.dumps(embedding)),
+                )
         return payload
 
-    def query_memories(self, user_id: str, query: str, limit: int = 5) -> list[dict[str, Any]]:
-        tokens = [tok for tok in re.findall(r"\w+", query.lower()) if tok]
+    async def add_memory_async(
+        self,
+        user_id: str,
+        text: str,
+        metadata: dict[str, Any] | None = None,
+        embedding: list[float] | None = None,
+    ) -> dict[str, Any]:
+        """Async wrapper for event-loop callers: the fsync-bound insert runs
+        on a worker thread instead of blocking the loop."""
+        return await asyncio.to_thread(self.add_memory, user_id, text, metadata, embedding)
+
+    async def query_memories_async(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 5,
+        query_embedding: list[float] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Async wrapper for event-loop callers; see add_memory_async."""
+        return await asyncio.to_thread(self.query_memories, user_id, query, limit, query_embedding)
+
+    def add_memories(self, items: list[tuple[str, str, dict[str, Any] | None]]) -> list[dict[str, Any]]:
+        """Insert many memories in one executemany + one commit.
+
+        Per-row commits cost one fsync each; batching amortizes the commit
+        across the whole burst.
+        """
+        payloads: list[dict[str, Any]] = []
+        rows: list[tuple[str, str, str, str, float]] = []
+        # One urandom read for the whole batch instead of one syscall per row.
+        id_bytes = os.urandom(16 * len(items))
+        for position, (user_id, text, metadata) in enumerate(items):
+            memory_id = id_bytes[16 * position : 16 * (position + 1)].hex()
+            payload = {
+                "id": memory_id,
+                "user_id": user_id,
+                "text": text,
+                "metadata": metadata or {},
+                "score": 1.0,
+            }
+            payloads.append(payload)
+            rows.append((memory_id, user_id, text, text.lower(), _dumps_metadata(payload["metadata"]), 1.0))
+        if rows:
+            with self._write_tx():
+                self._conn.executemany(_SQL_INSERT, rows)
+        return payloads
+
+    def query_memories(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 5,
+        query_embedding: list[float] | None = None,
+        metadata_filter: MetadataFilter | None = None,
+    ) -> list[dict[str, Any]]:
+        metadata_filter = _normalize_metadata_filter(metadata_filter)
+        if self._vec_enabled and query_embedding is not None:
+            sql = (
+                "SELECT m.id, m.user_id, m.text, m.metadata, m.score "
+                "FROM memory_vecs v JOIN memories m ON m.rowid = v.rowid "
+                "WHERE v.embedding MATCH ? AND m.user_id = ? "
+            )
+            params: list[Any] = [json.dumps(query_embedding), user_id]
+            if metadata_filter:
+                filter_sql, filter_params = _metadata_filter_sql(metadata_filter, column="m.metadata")
+                sql += f"AND {filter_sql} "
+                params.extend(filter_params)
+            sql += "ORDER BY v.distance LIMIT ?"
+            params.append(limit)
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+            return [self._row_to_payload(row) for row in rows]
+
+        query_lower = query.lower()
+        tokens = _TOKEN_RE.findall(query_lower)
+
+        if self._fts_enabled and tokens:
+            match = " ".join(f'"{tok}"*' for tok in tokens)
+            if metadata_filter:
+                filter_sql, filter_params = _metadata_filter_sql(metadata_filter, column="m.metadata")
+                sql = (
+                    "SELECT m.id, m.user_id, m.text, m.metadata, m.score "
+                    "FROM memories_fts f JOIN memories m ON m.rowid = f.rowid "
+                    f"WHERE f.user_id = ? AND memories_fts MATCH ? AND {filter_sql} "
+                    "ORDER BY f.rowid DESC LIMIT ?"
+                )
+                params = [user_id, match, *filter_params, limit]
+            else:
+                sql = _SQL_FTS_QUERY
+                params = [user_id, match, limit]
+            conn = self._checkout_read()
+            try:
+                return [self._row_to_payload(row) for row in conn.execute(sql, params)]
+            except sqlite3.OperationalError:
+                LOGGER.debug("FTS query failed for %r; falling back to LIKE", query)
+            finally:
+                self._checkin_read(conn)
+
+        return self._query_memories_like(user_id, query_lower, tokens, limit, metadata_filter)
+
+    def _query_memories_like(
+        self,
+        user_id: str,
+        query_lower: str,
+        tokens: list[str],
+        limit: int,
+        metadata_filter: MetadataFilter | None = None,
+    ) -> list[dict[str, Any]]:
         params: list[Any] = [user_id]
         where_clauses: list[str] = ["user_id = ?"]
 
         if tokens:
             for tok in tokens:
-                where_clauses.append("LOWER(text) LIKE ?")
+                where_clauses.append("text_lower LIKE ?")
                 params.append(f"%{tok}%")
         else:
-            where_clauses.append("LOWER(text) LIKE ?")
-            params.append(f"%{query.lower()}%")
+            where_clauses.append("text_lower LIKE ?")
+            params.append(f"%{query_lower}%")
+        if metadata_filter:
+            filter_sql, filter_params = _metadata_filter_sql(metadata_filter)
+            where_clauses.append(filter_sql)
+            params.extend(filter_params)
 
         sql = (
             "SELECT id, user_id, text, metadata, score "
@@ -305,66 +985,200 @@ class SQLiteMem0Client:
         )
         params.append(limit)
 
-        with self._lock:
-            rows = self._conn.execute(sql, params).fetchall()
+        conn = self._checkout_read()
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            self._checkin_read(conn)
         return [self._row_to_payload(row) for row in rows]
 
     def summarize(self, texts: list[str], max_length: int | None = None) -> str:
         max_chars = max_length or self.max_summary_chars
-        return _truncate(" ".join(texts), max_chars)
+        return _join_truncate(texts, max_chars)
 
     def delete_memory(self, memory_id: str) -> bool:
-        with self._lock, self._conn:
-            cur = self._conn.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
+        with self._write_tx():
+            cur = self._conn.execute(_SQL_DELETE, (memory_id,))
         return cur.rowcount > 0
 
-    def list_memories(self, user_id: str | None = None, limit: int | None = None) -> list[dict[str, Any]]:
-        query = "SELECT id, user_id, text, metadata, score FROM memories"
-        params: list[Any] = []
+    def delete_memories(self, memory_ids: list[str]) -> int:
+        """Delete many memories in one executemany + one commit."""
+        if not memory_ids:
+            return 0
+        with self._write_tx():
+            cur = self._conn.executemany(_SQL_DELETE, [(memory_id,) for memory_id in memory_ids])
+        return cur.rowcount
+
+    def _iter_rows(self, sql: str, params: tuple[Any, ...]) -> Iterator[dict[str, Any]]:
+        conn = self._checkout_read()
+        try:
+            for row in conn.execute(sql, params):
+                yield self._row_to_payload(row)
+        finally:
+            self._checkin_read(conn)
+
+    def iter_memories(
+        self, user_id: str | None = None, limit: int | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield payload dicts as consumed; rows stay plain tuples until then."""
         if user_id:
-            query += " WHERE user_id = ?"
-            params.append(user_id)
-        query += " ORDER BY rowid DESC"
-        if limit:
-            query += " LIMIT ?"
-            params.append(limit)
-        with self._lock:
-            rows = self._conn.execute(query, params).fetchall()
-        return [self._row_to_payload(row) for row in rows]
+            sql = _SQL_LIST_USER_LIMIT if limit else _SQL_LIST_USER
+            params: tuple[Any, ...] = (user_id, limit) if limit else (user_id,)
+        else:
+            sql = _SQL_LIST_LIMIT if limit else _SQL_LIST
+            params = (limit,) if limit else ()
+        yield from self._iter_rows(sql, params)
+
+    def list_memories(self, user_id: str | None = None, limit: int | None = None) -> list[dict[str, Any]]:
+        return list(self.iter_memories(user_id=user_id, limit=limit))
 
     def close(self) -> None:
-        """Close the underlying SQLite connection."""
+        """Close the underlying SQLite connections."""
+        timer = getattr(self, "_maintenance_timer", None)
+        if timer is not None:
+            timer.cancel()
+            self._maintenance_timer = None
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
         with self._lock:
             conn = getattr(self, "_conn", None)
             if conn:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                conn.execute("PRAGMA optimize")
                 conn.close()
                 self._conn = None
+        atexit.unregister(self.close)
 
-    def _row_to_payload(self, row: sqlite3.Row) -> dict[str, Any]:
-        metadata_str = row["metadata"]
+    def _row_to_payload(self, row: tuple[Any, ...]) -> dict[str, Any]:
+        memory_id, user_id, text, metadata_str, score = row
         metadata: dict[str, Any]
         if metadata_str:
             try:
-                metadata = json.loads(metadata_str)
-            except json.JSONDecodeError:
+                metadata = _loads_metadata(metadata_str)
+            except _metadata_decode_errors:
+                if isinstance(metadata_str, bytes):
+                    metadata_str = metadata_str.decode("utf-8", "replace")
                 metadata = {"raw": metadata_str}
         else:
             metadata = {}
         return {
-            "id": row["id"],
-            "user_id": row["user_id"],
-            "text": row["text"],
+            "id": memory_id,
+            "user_id": user_id,
+            "text": text,
             "metadata": metadata,
-            "score": row["score"],
+            "score": score,
         }
 
 
+@dataclass
+class TieredMem0Client:
+    """Bounded in-memory hot tier in front of a persistent SQLite cold tier.
+
+    Recall traffic skews heavily toward recent memories (reflection asks for
+    limit=3 against the current conversation), so queries scan the hot tier's
+    postings first and only touch disk when that comes up short. Writes go
+    through to SQLite — the cold tier stays authoritative — and the hot tier
+    mirrors the row under the same id, relying on InMemoryMem0Client's
+    per-user cap to evict the oldest entries, which keeps RSS bounded at
+    O(hot_per_user) regardless of store size.
+    """
+
+    cold: SQLiteMem0Client
+    hot_per_user: int = 1_000
+    max_summary_chars: int = 480
+    hot: InMemoryMem0Client = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.hot = InMemoryMem0Client(
+            max_summary_chars=self.max_summary_chars,
+            max_per_user=self.hot_per_user,
+        )
+
+    def add_memory(self, user_id: str, text: str, metadata: dict[str, Any] | None = None) -> dict[str, Any]:
+        payload = self.cold.add_memory(user_id, text, metadata)
+        self.hot.add_memory(user_id, text, metadata, memory_id=payload["id"])
+        return payload
+
+    def add_memories(self, items: list[tuple[str, str, dict[str, Any] | None]]) -> list[dict[str, Any]]:
+        payloads = self.cold.add_memories(items)
+        for payload in payloads:
+            self.hot.add_memory(
+                payload["user_id"], payload["text"], payload["metadata"], memory_id=payload["id"]
+            )
+        return payloads
+
+    def query_memories(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = 5,
+        metadata_filter: MetadataFilter | None = None,
+    ) -> list[dict[str, Any]]:
+        hits = self.hot.query_memories(user_id, query, limit, metadata_filter=metadata_filter)
+        if len(hits) >= limit:
+            return hits
+        seen = {hit["id"] for hit in hits}
+        for payload in self.cold.query_memories(user_id, query, limit, metadata_filter=metadata_filter):
+            if payload["id"] not in seen:
+                hits.append(payload)
+                if len(hits) >= limit:
+                    break
+        return hits
+
+    def delete_memory(self, memory_id: str) -> bool:
+        hot_deleted = self.hot.delete_memory(memory_id)
+        return self.cold.delete_memory(memory_id) or hot_deleted
+
+    def list_memories(self, user_id: str | None = None, limit: int | None = None) -> list[dict[str, Any]]:
+        return self.cold.list_memories(user_id=user_id, limit=limit)
+
+    def summarize(self, texts: list[str], max_length: int | None = None) -> str:
+        return _join_truncate(texts, max_length or self.max_summary_chars)
+
+    def close(self) -> None:
+        self.cold.close()
+
+
+@lru_cache(maxsize=2)
+def _resolve_mem0_client_cls(importer: Any) -> Any:
+    """Import the Mem0 SDK and resolve MemoryClient once per importer.
+
+    Keyed on the importer so tests that monkeypatch this module's
+    import_module get their own cache entry instead of a stale real one.
+    """
+    module = importer("mem0")
+    client_cls = getattr(module, "MemoryClient", None)
+    if not client_cls:
+        raise ModuleNotFoundError("Mem0 SDK does not expose MemoryClient")
+    return client_cls
+
+
 def _truncate(text: str, max_chars: int) -> str:
     if len(text) <= max_chars:
         return text
     return text[: max(0, max_chars - 3)] + "..."
 
 
+def _join_truncate(texts: Iterable[str], max_chars: int) -> str:
+    """Space-join texts, but stop consuming once the limit is crossed.
+
+    Joining everything first allocates the full concatenation even though only
+    max_chars of it survive the truncation; this keeps the working set
+    proportional to the limit instead of the input.
+    """
+    parts: list[str] = []
+    length = -1  # offsets the leading separator of the first part
+    for text in texts:
+        parts.append(text)
+        length += len(text) + 1
+        if length > max_chars:
+            break
+    return _truncate(" ".join(parts), max_chars)
+
+
 def _maybe_float(value: Any) -> float | None:
     try:
         return float(value)
@@ -386,10 +1200,7 @@ class Mem0RemoteClient:
         self._client = self._build_sdk_client()
 
     def _build_sdk_client(self) -> Any:
-        module = import_module("mem0")
-        client_cls = getattr(module, "MemoryClient", None)
-        if not client_cls:
-            raise ModuleNotFoundError("Mem0 SDK does not expose MemoryClient")
+        client_cls = _resolve_mem0_client_cls(import_module)
         if not self.api_key:
             raise ValueError("Mem0 SDK requires HIPPOCAMPUS_MEM0_API_KEY when remote backend is enabled")
         kwargs: dict[str, Any] = {"api_key": self.api_key}
@@ -405,10 +1216,85 @@ class Mem0RemoteClient:
             return results[0]
         return {"user_id": user_id, "text": text, "metadata": metadata or {}}
 
-    def query_memories(self, user_id: str, query: str, limit: int | None = None) -> list[dict[str, Any]]:
+    def add_memories(self, items: list[tuple[str, str, dict[str, Any] | None]]) -> list[dict[str, Any]]:
+        """Bulk add: one SDK round-trip per run of items sharing user+metadata.
+
+        The SDK's add() takes one user_id and one metadata per call, so items
+        are grouped into adjacent runs (grouping preserves insertion order);
+        a homogeneous ingestion batch collapses to a single HTTP request
+        instead of one per memory.
+        """
+        payloads: list[dict[str, Any]] = []
+        groups: list[tuple[str, dict[str, Any] | None, list[str]]] = []
+        for user_id, text, metadata in items:
+            if groups and groups[-1][0] == user_id and groups[-1][1] == metadata:
+                groups[-1][2].append(text)
+            else:
+                groups.append((user_id, metadata, [text]))
+        for user_id, metadata, texts in groups:
+            messages = [{"role": "user", "content": text} for text in texts]
+            response = self._client.add(messages=messages, user_id=user_id, metadata=metadata)
+            results = self._extract_results(response)
+            if results:
+                payloads.extend(results)
+            else:
+                payloads.extend(
+                    {"user_id": user_id, "text": text, "metadata": metadata or {}} for text in texts
+                )
+        return payloads
+
+    def delete_memories(self, memory_ids: list[str]) -> int:
+        """Delete many memories in as few round-trips as the SDK allows.
+
+        Uses the bulk endpoint when the SDK exposes one; otherwise the single
+        deletes are issued concurrently so wall-clock is one RTT, not N.
+        """
+        if not memory_ids:
+            return 0
+        batch_delete = getattr(self._client, "batch_delete", None)
+        if callable(batch_delete):
+            batch_delete([{"memory_id": memory_id} for memory_id in memory_ids])
+            return len(memory_ids)
+        with ThreadPoolExecutor(max_workers=min(8, len(memory_ids))) as pool:
+            results = list(pool.map(self.delete_memory, memory_ids))
+        deleted = 0
+        for result in results:
+            if isinstance(result, dict):
+                deleted += bool(result.get("deleted"))
+            else:
+                deleted += bool(result)
+        return deleted
+
+    def query_memories(
+        self,
+        user_id: str,
+        query: str,
+        limit: int | None = None,
+        metadata_filter: MetadataFilter | None = None,
+    ) -> list[dict[str, Any]]:
         top_k = limit or self.default_query_limit
         response = self._client.search(query=query, user_id=user_id, top_k=top_k, limit=top_k)
-        return self._extract_results(response)
+        results = self._extract_results(response)
+        metadata_filter = _normalize_metadata_filter(metadata_filter)
+        if metadata_filter:
+            # The hosted API has no comparable predicate, so filter the
+            # (already limit-bounded) response client-side.
+            results = [
+                item for item in results
+                if _metadata_matches(item.get("metadata") or {}, metadata_filter)
+            ]
+        return results
+
+    async def query_memories_async(
+        self,
+        user_id: str,
+        query: str,
+        limit: int | None = None,
+        metadata_filter: MetadataFilter | None = None,
+    ) -> list[dict[str, Any]]:
+        """Async wrapper: the blocking SDK search runs on a worker thread so
+        event-loop callers can overlap several lookups."""
+        return await asyncio.to_thread(self.query_memories, user_id, query, limit, metadata_filter)
 
     def delete_memory(self, memory_id: str) -> bool | dict[str, Any]:
         response = self._client.delete(memory_id=memory_id)
@@ -434,7 +1320,7 @@ class Mem0RemoteClient:
         return []
 
     def summarize(self, texts: list[str], max_length: int | None = None) -> str:
-        return _truncate(" ".join(texts), max_length or self.summary_max_length)
+        return _join_truncate(texts, max_length or self.summary_max_length)
 
     def _extract_results(self, payload: Any) -> list[dict[str, Any]]:
         if isinstance(payload, dict):
@@ -455,4 +1341,4 @@ class Mem0RemoteClient:
         return parsed
 
 
-__all__ = ["Mem0Adapter", "InMemoryMem0Client", "SQLiteMem0Client", "Mem0RemoteClient"]
+__all__ = ["Mem0Adapter", "InMemoryMem0Client", "SQLiteMem0Client", "TieredMem0Client", "Mem0RemoteClient"]
@@ -1,8 +1,13 @@
-"""Pydantic models for the hippocampus API."""
+"""Pydantic models for the hippocampus API.
+
+Pydantic stays on the request/validation side; the high-volume query
+response additionally has msgspec struct twins used on the encode path.
+"""
 from __future__ import annotations
 
 from typing import Any
 
+import msgspec
 from pydantic import BaseModel, Field
 
 
@@ -24,6 +29,10 @@ class MemoryCreateResponse(BaseModel):
     memory: MemoryRecord
 
 
+class MemoryBatchCreateResponse(BaseModel):
+    memories: list[MemoryRecord]
+
+
 class MemoryQueryResponse(BaseModel):
     memories: list[MemoryRecord]
 
@@ -53,3 +62,27 @@ class MatrixRelayRequest(BaseModel):
 
 class MatrixRelayResponse(BaseModel):
     reply: str
+
+
+class ExperienceCreateStruct(msgspec.Struct, frozen=True):
+    """Decode twin of ExperienceCreate for the bulk ingest path.
+
+    msgspec validates field types at C speed; the non-empty text check lives
+    in the route since msgspec has no min_length constraint.
+    """
+
+    user_id: str
+    text: str
+    metadata: dict[str, Any] = {}
+
+
+class MemoryRecordStruct(msgspec.Struct, frozen=True):
+    id: str
+    user_id: str
+    text: str
+    metadata: dict[str, Any] = {}
+    score: float | None = None
+
+
+class MemoryQueryResponseStruct(msgspec.Struct, frozen=True):
+    memories: list[MemoryRecordStruct] = []
@@ -16,8 +16,17 @@ SOFT_PHRASES = [
 LOGISTICS_KEYWORDS = {"token", "secret", "password", "api key", "ip", "port", "localhost", "127.", "host.docker.internal"}
 
 
+_WORD_RE = re.compile(r"\w+")
+# One alternation scan instead of eight serial substring passes per text.
+_LOGISTICS_RE = re.compile("|".join(re.escape(k) for k in LOGISTICS_KEYWORDS))
+
+# The eligibility predicate, in the backend's filter shape (OR of AND-clauses)
+# so ineligible rows are dropped in storage instead of shipped here first.
+ELIGIBLE_MEMORY_FILTER = ({"kind": "thread"}, {"kind": "preference"}, {"sticky": True})
+
+
 def _tokenize(text: str) -> list[str]:
-    return [t for t in re.findall(r"\w+", text.lower()) if t]
+    return _WORD_RE.findall(text.lower())
 
 
 def _overlap_score(a: str, b: str) -> float:
@@ -28,24 +37,40 @@ def _overlap_score(a: str, b: str) -> float:
     return len(ta & tb) / len(tb)
 
 
-def reflection_pass(
+def reflection_pass(  # noqa: PLR0913, PLR0917 — callers pass positionally; narrowing would break them
     adapter,
     user_id: str,
     user_message: str,
     assistant_reply: str,
     max_candidates: int = 3,
+    candidates: list[dict] | None = None,
 ) -> str:
     """
     Produce a short reflection sentence based on relevant memories.
-    - Queries up to max_candidates memories.
+    - Queries up to max_candidates memories (or scores pre-fetched candidates).
     - Only kinds thread/preference (or sticky) are eligible.
     - Filters out sensitive/logistics unless present in the current message.
     """
     combined = f"{user_message} {assistant_reply}".strip()
-    memories = adapter.query_memories(user_id=user_id, query=combined, limit=max_candidates) or []
+    if candidates is not None:
+        memories = candidates[:max_candidates]
+    else:
+        memories = adapter.query_memories(
+            user_id=user_id,
+            query=combined,
+            limit=max_candidates,
+            metadata_filter=ELIGIBLE_MEMORY_FILTER,
+        ) or []
 
-    eligible: list[dict] = []
     convo_lower = combined.lower()
+    combined_tokens = set(_WORD_RE.findall(convo_lower))
+    convo_logistics = _LOGISTICS_RE.search(convo_lower) is not None
+
+    # Eligibility pass builds a small inverted index (token -> candidate
+    # positions) so scoring is one posting-list sweep over the conversation
+    # tokens instead of a per-memory set intersection.
+    candidates_meta: list[tuple[dict, bool]] = []
+    postings: dict[str, list[int]] = {}
     for mem in memories:
         meta = mem.get("metadata") or {}
         kind = (meta.get("kind") or "").lower()
@@ -55,24 +80,31 @@ def reflection_pass(
         text = mem.get("text") or mem.get("memory") or ""
         if not text:
             continue
-        if meta.get("sensitive") and not _overlap_score(text, combined):
+        text_lower = text.lower()
+        if not convo_logistics and _LOGISTICS_RE.search(text_lower):
             continue
-        if any(k in text.lower() for k in LOGISTICS_KEYWORDS) and not any(k in convo_lower for k in LOGISTICS_KEYWORDS):
+        index = len(candidates_meta)
+        for token in set(_WORD_RE.findall(text_lower)):
+            postings.setdefault(token, []).append(index)
+        candidates_meta.append((mem, bool(meta.get("sensitive"))))
+
+    hits = [0] * len(candidates_meta)
+    for token in combined_tokens:
+        for index in postings.get(token, ()):
+            hits[index] += 1
+
+    denominator = len(combined_tokens)
+    best_score = 0.0
+    best_mem: dict | None = None
+    for index, (mem, sensitive) in enumerate(candidates_meta):
+        score = hits[index] / denominator if denominator else 0.0
+        if sensitive and not score:
             continue
-        eligible.append(mem)
-
-    if not eligible:
-        return ""
-
-    scored = []
-    for mem in eligible:
-        text = mem.get("text") or mem.get("memory") or ""
-        score = _overlap_score(text, combined)
-        scored.append((score, mem))
+        if best_mem is None or score > best_score:
+            best_score = score
+            best_mem = mem
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    best_score, best_mem = scored[0]
-    if best_score < 0.08:
+    if best_mem is None or best_score < 0.08:
         return ""
 
     snippet = (best_mem.get("text") or best_mem.get("memory") or "").strip()
@@ -85,4 +117,4 @@ def reflection_pass(
     return f"{prefix} {phrase} {snippet}"
 
 
-__all__ = ["reflection_pass"]
+__all__ = ["reflection_pass", "ELIGIBLE_MEMORY_FILTER"]
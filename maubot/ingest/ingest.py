@@ -1,9 +1,8 @@
 """Maubot plugin that forwards Matrix messages to the ingest service."""
 from __future__ import annotations
 
-import asyncio
 import time
-from collections import OrderedDict
+from array import array
 from typing import Any
 
 import aiohttp
@@ -12,29 +11,59 @@ from mautrix.types import EventType, MessageType
 
 from maubot import MessageEvent, Plugin
 
+try:
+    import orjson
+
+    _dumps_body = orjson.dumps
+except ImportError:  # pragma: no cover - plugin envs may lack orjson
+    import json
+
+    def _dumps_body(payload: Any) -> bytes:
+        return json.dumps(payload).encode()
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class Deduper:
-    """Simple TTL + size-limited cache of event_ids to prevent duplicates."""
+    """Simple TTL + size-limited cache of event_ids to prevent duplicates.
+
+    Laid out as a preallocated ring buffer (timestamp array + id slots) with
+    an id->slot dict, instead of an OrderedDict of boxed floats: fixed memory
+    at max_size entries and O(1) per call. Expired entries simply fail the
+    TTL check on lookup and are overwritten as the ring advances.
+    """
 
     def __init__(self, ttl_seconds: int, max_size: int) -> None:
-        self.ttl = ttl_seconds
+        # Nanosecond integers from the monotonic clock: immune to NTP/DST
+        # jumps and comparisons stay in fast int arithmetic.
+        self.ttl_ns = ttl_seconds * 1_000_000_000
         self.max_size = max_size
-        self._cache: OrderedDict[str, float] = OrderedDict()
-        self._lock = asyncio.Lock()
-
-    async def seen(self, event_id: str) -> bool:
-        now = time.time()
-        async with self._lock:
-            # drop expired
-            expired = [k for k, ts in self._cache.items() if now - ts > self.ttl]
-            for k in expired:
-                self._cache.pop(k, None)
-            if event_id in self._cache:
+        self._ts = array("q", bytes(8 * max_size))
+        self._ids: list[str | None] = [None] * max_size
+        self._index: dict[str, int] = {}
+        self._head = 0
+
+    def seen(self, event_id: str, now_ns: int | None = None) -> bool:
+        # Maubot dispatches handlers on a single event loop thread and this
+        # method never awaits, so the mutations are already serial; a lock
+        # would only add an acquire/release per message.
+        now = time.monotonic_ns() if now_ns is None else now_ns
+        slot = self._index.get(event_id)
+        if slot is not None:
+            if now - self._ts[slot] <= self.ttl_ns:
                 return True
-            self._cache[event_id] = now
-            # prune size
-            while len(self._cache) > self.max_size:
-                self._cache.popitem(last=False)
+            # Expired: refresh in place so the id keeps a single slot.
+            self._ts[slot] = now
+            return False
+        head = self._head
+        evicted = self._ids[head]
+        if evicted is not None:
+            self._index.pop(evicted, None)
+        self._ids[head] = event_id
+        self._ts[head] = now
+        self._index[event_id] = head
+        self._head = (head + 1) % self.max_size
         return False
 
 
@@ -42,6 +71,10 @@ class IngestPlugin(Plugin):
     async def start(self) -> None:
         settings = _load_settings(self.config)
         self.settings = settings
+        # Per-message hot fields cached as attributes; saves a dict lookup on
+        # every event and keeps the allowlist a frozenset for membership.
+        self._rooms_allowlist = settings["rooms_allowlist"]
+        self._api_key = settings["api_key"]
         self.client_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=2))
         self.deduper = Deduper(
             ttl_seconds=settings["cache_ttl_seconds"],
@@ -60,13 +93,15 @@ class IngestPlugin(Plugin):
 
     @event.on(EventType.ROOM_MESSAGE)
     async def message_handler(self, evt: MessageEvent) -> None:
+        # Cheapest filters first: most high-volume traffic (bot echoes,
+        # unlisted rooms) should bail before any allocation happens.
         if evt.sender == self.client.mxid:
             return
-        if evt.content.msgtype != MessageType.TEXT:
+        if self._rooms_allowlist and evt.room_id not in self._rooms_allowlist:
             return
-        if self.settings["rooms_allowlist"] and evt.room_id not in self.settings["rooms_allowlist"]:
+        if evt.content.msgtype != MessageType.TEXT:
             return
-        if await self.deduper.seen(evt.event_id):
+        if self.deduper.seen(evt.event_id):
             return
 
         body = evt.content.body.strip()
@@ -96,13 +131,14 @@ class IngestPlugin(Plugin):
             "metadata": _build_metadata(evt),
         }
 
-        headers = {}
-        if self.settings["api_key"]:
-            headers["X-API-Key"] = self.settings["api_key"]
+        # Pre-encode the body to bytes so aiohttp skips its own json encoder.
+        headers = dict(_JSON_HEADERS)
+        if self._api_key:
+            headers["X-API-Key"] = self._api_key
 
         try:
             async with self.client_session.post(
-                self.settings["ingest_url"], json=payload, headers=headers
+                self.settings["ingest_url"], data=_dumps_body(payload), headers=headers
             ) as resp:
                 if resp.status == 200 and self.settings["react_success"]:
                     await evt.react("✅")
@@ -125,7 +161,8 @@ class IngestPlugin(Plugin):
         try:
             async with self.client_session.post(
                 f"{self.settings['governor_url'].rstrip('/')}/remember",
-                json=payload,
+                data=_dumps_body(payload),
+                headers=_JSON_HEADERS,
             ) as resp:
                 if resp.status == 200:
                     await evt.reply("Stored.")
@@ -148,7 +185,8 @@ class IngestPlugin(Plugin):
         try:
             async with self.client_session.post(
                 f"{self.settings['governor_url'].rstrip('/')}/recall",
-                json=payload,
+                data=_dumps_body(payload),
+                headers=_JSON_HEADERS,
             ) as resp:
                 if resp.status != 200:
                     self.log.warning("Recall failed (%s): %s", resp.status, await resp.text())
@@ -190,7 +228,7 @@ def _load_settings(config_obj: Any) -> dict[str, Any]:
         "ingest_url": "http://172.23.0.1:54323/observe",
         "governor_url": "http://172.23.0.1:54323",
         "api_key": "",
-        "rooms_allowlist": set(),
+        "rooms_allowlist": frozenset(),
         "recall_top_k": 5,
         "react_success": False,
         "log_level": "INFO",
@@ -206,7 +244,7 @@ def _load_settings(config_obj: Any) -> dict[str, Any]:
     settings = dict(defaults)
     # handle room list
     rooms = raw.get("rooms_allowlist") or []
-    settings["rooms_allowlist"] = set(rooms)
+    settings["rooms_allowlist"] = frozenset(rooms)
     for key in ("ingest_url", "governor_url", "api_key", "react_success", "log_level"):
         if key in raw:
             settings[key] = raw[key]
@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import heapq
 import logging
+import operator
+import re
 import time
+from functools import lru_cache
 from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from memory_governor.clients import HippocampusClient
 from memory_governor.config import GovernorConfig, load_config
@@ -41,11 +46,63 @@ LOGGER = logging.getLogger("memory_governor")
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
 
 
-def _keywords_from_text(text: str, min_len: int = 4) -> list[str]:
-    import re
+_WORD_RE = re.compile(r"\w+")
 
-    tokens = re.findall(r"\w+", text.lower())
-    return sorted({t for t in tokens if len(t) >= min_len})
+
+@lru_cache(maxsize=512)
+def _keywords_from_text(text: str, min_len: int = 4) -> tuple[str, ...]:
+    # dict.fromkeys dedups in C while keeping first-seen order; consumers only
+    # need uniqueness, so the lexicographic sort was wasted work. The cache
+    # returns a tuple so repeated texts (templated notifications, reminders)
+    # share one immutable result instead of re-tokenizing.
+    return tuple(dict.fromkeys(t for t in _WORD_RE.findall(text.lower()) if len(t) >= min_len))
+
+
+# itemgetter runs in C; a per-request lambda key would allocate a new
+# function object on every /recall.
+_SCORE_OF_PAIR = operator.itemgetter(1)
+
+
+def _recall_score(  # noqa: PLR0913, PLR0917 — explicit context args avoid a per-request closure
+    item: dict[str, Any],
+    now: float,
+    recall_counts: dict[str, int],
+    dream_promotions: dict[str, dict[str, Any]],
+    dream_window_ts: float,
+    dream_weight: float,
+    filter_scope_path: str | None,
+) -> float:
+    """Ranking score for one filtered recall item.
+
+    Module-level (context passed explicitly) so request handlers don't build
+    a closure with captured cells per call.
+    """
+    conf = item.get("confidence") or 0.5
+    ts_val = item.get("timestamp")
+    if ts_val:
+        age_days = max(0.0, (now - float(ts_val)) / 86400.0)
+        recency = max(0.0, 1.0 - age_days / 30.0)
+    else:
+        recency = 0.3
+    mid = item.get("memory_id")
+    rc = recall_counts.get(mid, 0) if mid else 0
+    recall_boost = min(1.0, rc / 10.0)
+    outcome_bonus = 1.0 if item.get("last_outcome") == "good" else 0.0
+    exact_bonus = 0.05 if (
+        filter_scope_path is not None and item.get("scope_path") == filter_scope_path
+    ) else 0.0
+    dream_row = dream_promotions.get(mid) if mid else None
+    dream_boost = 0.0
+    if dream_row and (dream_row.get("last_dreamed_at") or 0) >= dream_window_ts:
+        dream_boost = float(dream_row.get("last_score") or 0.0)
+    return (
+        conf * 0.6
+        + recency * 0.2
+        + recall_boost * 0.1
+        + outcome_bonus * 0.1
+        + exact_bonus
+        + dream_boost * dream_weight
+    )
 
 
 def _scope_path_from_meta(meta: dict[str, Any]) -> str | None:
@@ -84,12 +141,20 @@ class GovernorRuntime:
         self._queue_rt: asyncio.Queue | None = None
         self._worker: asyncio.Task | None = None
 
-    def enqueue_memory(self, payload: dict[str, Any]) -> str:
-        job = self.queue.enqueue({"type": "memory", "payload": payload})
-        if self._queue_rt:
+    def _enqueue(self, item: dict[str, Any]) -> str:
+        # Hot request path: hand the job straight to the in-memory queue and
+        # let the worker do the durable spool write before delivery. Without a
+        # running worker (scripts, tests) fall back to persisting inline.
+        job = self.queue.make_job(item)
+        if self._queue_rt is not None:
             self._queue_rt.put_nowait(job)
+        else:
+            self.queue.persist_jobs([job])
         return job["id"]
 
+    def enqueue_memory(self, payload: dict[str, Any]) -> str:
+        return self._enqueue({"type": "memory", "payload": payload})
+
     def enqueue_recall_hit(
         self,
         memory_id: str,
@@ -101,16 +166,10 @@ class GovernorRuntime:
             payload["query_hash"] = query_hash
         if rerank_score is not None:
             payload["rerank_score"] = float(rerank_score)
-        job = self.queue.enqueue({"type": "recall_hit", "payload": payload})
-        if self._queue_rt:
-            self._queue_rt.put_nowait(job)
-        return job["id"]
+        return self._enqueue({"type": "recall_hit", "payload": payload})
 
     def enqueue_delete(self, memory_id: str) -> str:
-        job = self.queue.enqueue({"type": "delete_memory", "payload": {"memory_id": memory_id}})
-        if self._queue_rt:
-            self._queue_rt.put_nowait(job)
-        return job["id"]
+        return self._enqueue({"type": "delete_memory", "payload": {"memory_id": memory_id}})
 
     async def _process_job(self, job: dict[str, Any]) -> bool:
         # DurableQueue wraps items in {"id", "payload", "ts"} envelope.
@@ -146,35 +205,50 @@ class GovernorRuntime:
         LOGGER.warning("Unknown job type: %s (keys: %s)", job_type, list(job.keys()))
         return True
 
-    async def _worker_loop(self) -> None:
+    async def _worker_loop(self, batch_size: int = 16) -> None:
         assert self._queue_rt is not None
         while True:
-            job = await self._queue_rt.get()
-            try:
-                ok = await self._process_job(job)
-                if ok:
+            # Drain up to batch_size jobs so their HTTP posts overlap instead
+            # of serializing one network round-trip per job; the batch size
+            # also bounds in-flight concurrency against Hippocampus.
+            jobs = [await self._queue_rt.get()]
+            while len(jobs) < batch_size:
+                try:
+                    jobs.append(self._queue_rt.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            # Persist the batch before delivery so a crash mid-flight still
+            # replays these jobs from the spool on restart.
+            self.queue.persist_jobs(jobs)
+            results = await asyncio.gather(
+                *(self._process_job(job) for job in jobs), return_exceptions=True
+            )
+            requeued = False
+            for job, ok in zip(jobs, results, strict=True):
+                if ok is True:
                     self.queue.mark_done(job["id"])
-                else:
-                    # keep it; requeue after delay
-                    await asyncio.sleep(2)
-                    self._queue_rt.put_nowait(job)
-            except Exception as exc:  # pragma: no cover - defensive
-                LOGGER.error("Worker failed: %s", exc, exc_info=True)
-                await asyncio.sleep(2)
+                    continue
+                if isinstance(ok, BaseException):  # pragma: no cover - defensive
+                    LOGGER.error("Worker failed: %s", ok, exc_info=ok)
+                # keep it; requeue after delay
                 self._queue_rt.put_nowait(job)
+                requeued = True
+            if requeued:
+                await asyncio.sleep(2)
 
     async def start(self) -> None:
         self._queue_rt = asyncio.Queue()
-        for job in self.queue.pending():
+        pending = self.queue.pending()
+        for job in pending:
             self._queue_rt.put_nowait(job)
         self._worker = asyncio.create_task(self._worker_loop())
-        LOGGER.info("Memory Governor worker started with %d pending jobs", len(self.queue.pending()))
+        LOGGER.info("Memory Governor worker started with %d pending jobs", len(pending))
 
 
 cfg = load_config()
 runtime = GovernorRuntime(cfg)
 
-app = FastAPI(title="Memory Governor", version="0.1.0")
+app = FastAPI(title="Memory Governor", version="0.1.0", default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -191,6 +265,11 @@ async def _on_startup() -> None:
     await runtime.start()
 
 
+@app.on_event("shutdown")
+async def _on_shutdown() -> None:
+    await runtime.hippo.aclose()
+
+
 @app.get("/health")
 async def health() -> dict[str, str]:
     return {"status": "ok"}
@@ -212,6 +291,9 @@ async def observe(payload: ObserveRequest) -> ObserveResponse:
             action="working",
             decision={"salience": 0.0, "kind": "ignore"},
         )
+    # Serialize the scope once per request; model_dump walks the model and
+    # allocates a fresh dict on every call.
+    scope_dict = payload.scope.model_dump()
     if runtime.stream:
         runtime.stream.append(
             {
@@ -219,20 +301,20 @@ async def observe(payload: ObserveRequest) -> ObserveResponse:
                 "user_id": payload.user_id,
                 "text": payload.text,
                 "timestamp": payload.timestamp or int(time.time()),
-                "scope": payload.scope.dict(),
+                "scope": scope_dict,
                 "metadata": payload.metadata,
             }
         )
     salience, decision_kind = classify_observation(payload)
 
     if decision_kind == "candidate":
-        keywords = _keywords_from_text(payload.text)
+        keywords = list(_keywords_from_text(payload.text))
         memory_payload = {
             "user_id": payload.user_id,
             "text": payload.text,
             "metadata": {
                 "source": payload.source,
-                "scope": payload.scope.dict(),
+                "scope": scope_dict,
                 "kind": "episodic",
                 "salience": max(0.7, salience),
                 "keywords": keywords,
@@ -259,13 +341,13 @@ async def remember(payload: RememberRequest) -> RememberResponse:
     canon = clean_text
     payload.metadata = payload.metadata or {}
     payload.metadata.setdefault("tier", tier)
-    keywords = _keywords_from_text(canon)
+    keywords = list(_keywords_from_text(canon))
     memory_payload = {
         "user_id": payload.user_id,
         "text": canon,
         "metadata": {
             "source": payload.source,
-            "scope": payload.scope.dict(),
+            "scope": payload.scope.model_dump(),
             "kind": payload.kind,
             "salience": 1.0,
             "confidence": 0.95,
@@ -402,37 +484,24 @@ async def recall(payload: RecallRequest) -> RecallResponse:
     dream_window_ts = now - runtime.cfg.dream_boost_window_days * 86400
     dream_weight = runtime.cfg.dream_boost_weight
 
-    def _score(item: dict[str, Any]) -> float:
-        conf = item.get("confidence") or 0.5
-        ts_val = item.get("timestamp")
-        if ts_val:
-            age_days = max(0.0, (now - float(ts_val)) / 86400.0)
-            recency = max(0.0, 1.0 - age_days / 30.0)
-        else:
-            recency = 0.3
-        mid = item.get("memory_id")
-        rc = recall_counts.get(mid, 0) if mid else 0
-        recall_boost = min(1.0, rc / 10.0)
-        outcome_bonus = 1.0 if item.get("last_outcome") == "good" else 0.0
-        exact_bonus = 0.05 if (
-            filter_scope_path is not None and item.get("scope_path") == filter_scope_path
-        ) else 0.0
-        dream_row = dream_promotions.get(mid) if mid else None
-        dream_boost = 0.0
-        if dream_row and (dream_row.get("last_dreamed_at") or 0) >= dream_window_ts:
-            dream_boost = float(dream_row.get("last_score") or 0.0)
-        return (
-            conf * 0.6
-            + recency * 0.2
-            + recall_boost * 0.1
-            + outcome_bonus * 0.1
-            + exact_bonus
-            + dream_boost * dream_weight
+    # Feed (item, score) pairs to nlargest as a generator: only the O(k) heap
+    # is ever held, not a second scored copy of the candidate list.
+    scored = (
+        (
+            item,
+            _recall_score(
+                item,
+                now,
+                recall_counts,
+                dream_promotions,
+                dream_window_ts,
+                dream_weight,
+                filter_scope_path,
+            ),
         )
-
-    scored = [(item, _score(item)) for item in filtered]
-    scored.sort(key=lambda pair: pair[1], reverse=True)
-    top = scored[: payload.k]
+        for item in filtered
+    )
+    top = heapq.nlargest(payload.k, scored, key=_SCORE_OF_PAIR)
 
     query_hash = (
         hashlib.sha1(payload.query.strip().lower().encode("utf-8")).hexdigest()[:16]
@@ -550,7 +619,7 @@ async def consolidate(payload: ConsolidateRequest) -> ConsolidateResponse:
     events = runtime.store.recent_for_scope(payload.scope, limit=payload.max_items * 3)
     if not events:
         return ConsolidateResponse(status="ok", written={"episodic": 0, "semantic": 0, "procedural": 0}, skipped=0)
-    grouped = consolidate_events(events, mode=payload.mode)
+    grouped, newest_ts = consolidate_events(events, mode=payload.mode)
     written_counts = {"episodic": 0, "semantic": 0, "procedural": 0}
     skipped = 0
     for kind, items in grouped.items():
@@ -570,7 +639,6 @@ async def consolidate(payload: ConsolidateRequest) -> ConsolidateResponse:
             written_counts[kind] += 1
         if len(items) > payload.max_items:
             skipped += len(items) - payload.max_items
-    newest_ts = max(evt.get("timestamp", 0) for evt in events)
     runtime.store.mark_consolidated(payload.scope, newest_ts)
     return ConsolidateResponse(
         status="ok",
@@ -1,12 +1,31 @@
 from __future__ import annotations
 
+import heapq
 import logging
+import re
+import time
 from typing import Any
 
 import httpx
+import orjson
 
 LOGGER = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"content-type": "application/json"}
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _recency_score(mem: dict[str, Any], now: float) -> float:
+    """Recency weight for the local match fallback; module-level so callers
+    don't rebuild a closure per request."""
+    ts = (mem.get("metadata", {}) or {}).get("timestamp")
+    try:
+        age_days = max(0.0, (now - float(ts)) / 86400.0)
+        return max(0.0, 1.0 - age_days / 30.0)
+    except (TypeError, ValueError):
+        return 0.3
+
 
 class HippocampusClient:
     def __init__(
@@ -28,6 +47,16 @@ class HippocampusClient:
         self.rerank_max = rerank_max
         self.litellm_base_url = litellm_base_url
         self.litellm_api_key = litellm_api_key
+        # One long-lived client: per-call AsyncClients paid a fresh TCP/TLS
+        # handshake for every write and recall; keep-alive reuse drops that to
+        # one round-trip per request. Closed via aclose() on app shutdown.
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
 
     def _headers(self) -> dict[str, str]:
         headers: dict[str, str] = {}
@@ -38,13 +67,18 @@ class HippocampusClient:
     async def _rerank(self, query: str, candidates: list[dict[str, Any]]) -> list[dict[str, Any]]:
         if not (self.rerank_enabled and self.litellm_base_url and self.rerank_model and candidates):
             return candidates
-        import json as _json
-
+        # With two or fewer candidates there is nothing meaningful to
+        # reorder; skip the LLM round-trip (usually hundreds of ms).
+        if len(candidates) <= 2:
+            return candidates
+        # orjson emits UTF-8 without ASCII escaping, matching the old
+        # ensure_ascii=False output.
+        memories_json = orjson.dumps(candidates[: self.rerank_max]).decode()
         prompt = (
             "Reorder the following memories by relevance to the query. "
             "Return JSON array of the memory objects, unchanged, just reordered.\n"
             f"Query: {query}\n"
-            f"Memories: {_json.dumps(candidates[: self.rerank_max], ensure_ascii=False)}"
+            f"Memories: {memories_json}"
         )
         payload = {
             "model": self.rerank_model,
@@ -55,35 +89,39 @@ class HippocampusClient:
             headers["Authorization"] = f"Bearer {self.litellm_api_key}"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                resp = await client.post(
-                    f"{self.litellm_base_url}/v1/chat/completions",
-                    json=payload,
-                    headers=headers,
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                content = data["choices"][0]["message"]["content"]
-                parsed = _json.loads(content)
-                if isinstance(parsed, list):
-                    return parsed
+            resp = await self._client.post(
+                f"{self.litellm_base_url}/v1/chat/completions",
+                content=orjson.dumps(payload),
+                headers=headers,
+            )
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            content = data["choices"][0]["message"]["content"]
+            parsed = orjson.loads(content)
+            if isinstance(parsed, list):
+                return parsed
         except Exception as exc:
             LOGGER.warning("Rerank failed, using original order: %s", exc)
         return candidates
 
     async def post_memory(self, payload: dict[str, Any]) -> str | None:
         """Write a memory directly to Hippocampus."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                resp = await client.post(
-                    f"{self.hippo_url}/memories", json=payload, headers=self._headers()
-                )
-                resp.raise_for_status()
-                data = resp.json()
-                return data.get("memory", {}).get("id") or data.get("id") or "hippo-ok"
-            except Exception as exc:
-                LOGGER.error("Hippocampus write failed: %s", exc)
-                return None
+        try:
+            resp = await self._client.post(
+                f"{self.hippo_url}/memories",
+                content=orjson.dumps(payload),
+                headers={**_JSON_HEADERS, **self._headers()},
+            )
+        except Exception as exc:
+            LOGGER.error("Hippocampus write failed: %s", exc)
+            return None
+        # Success path stays exception-free: a status check beats building
+        # and unwinding HTTPStatusError on the per-memory write hot path.
+        if resp.is_success:
+            data = orjson.loads(resp.content)
+            return data.get("memory", {}).get("id") or data.get("id") or "hippo-ok"
+        LOGGER.error("Hippocampus write failed: HTTP %s", resp.status_code)
+        return None
 
     async def get_memory(self, user_id: str, memory_id: str) -> dict[str, Any] | None:
         """Fetch a single memory by id for user_id. Returns None if not found.
@@ -91,18 +129,17 @@ class HippocampusClient:
         Hippocampus exposes no single-id GET, so we list the user's memories
         and filter. Fine for outcome validation (low call rate).
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                resp = await client.get(
-                    f"{self.hippo_url}/memories/{user_id}",
-                    params={"limit": 500},
-                    headers=self._headers(),
-                )
-                resp.raise_for_status()
-                data = resp.json()
-            except Exception as exc:
-                LOGGER.error("Hippocampus lookup failed: %s", exc)
-                return None
+        try:
+            resp = await self._client.get(
+                f"{self.hippo_url}/memories/{user_id}",
+                params={"limit": 500},
+                headers=self._headers(),
+            )
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+        except Exception as exc:
+            LOGGER.error("Hippocampus lookup failed: %s", exc)
+            return None
         for mem in data.get("memories", []):
             if mem.get("id") == memory_id:
                 return mem
@@ -112,31 +149,29 @@ class HippocampusClient:
         self, user_id: str, limit: int = 500
     ) -> list[dict[str, Any]]:
         """List all memories for user_id (up to limit). Used by dreaming sweeps."""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                resp = await client.get(
-                    f"{self.hippo_url}/memories/{user_id}",
-                    params={"limit": limit},
-                    headers=self._headers(),
-                )
-                resp.raise_for_status()
-                return resp.json().get("memories", [])
-            except Exception as exc:
-                LOGGER.error("Hippocampus list failed: %s", exc)
-                return []
+        try:
+            resp = await self._client.get(
+                f"{self.hippo_url}/memories/{user_id}",
+                params={"limit": limit},
+                headers=self._headers(),
+            )
+            resp.raise_for_status()
+            return orjson.loads(resp.content).get("memories", [])
+        except Exception as exc:
+            LOGGER.error("Hippocampus list failed: %s", exc)
+            return []
 
     async def delete_memory(self, memory_id: str) -> bool:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                resp = await client.delete(
-                    f"{self.hippo_url}/memories/{memory_id}",
-                    headers=self._headers(),
-                )
-                resp.raise_for_status()
-                return True
-            except Exception as exc:
-                LOGGER.error("Hippocampus delete failed: %s", exc)
-                return False
+        try:
+            resp = await self._client.delete(
+                f"{self.hippo_url}/memories/{memory_id}",
+                headers=self._headers(),
+            )
+            resp.raise_for_status()
+            return True
+        except Exception as exc:
+            LOGGER.error("Hippocampus delete failed: %s", exc)
+            return False
 
     async def query_memories(
         self, user_id: str, query: str, limit: int | None = None
@@ -144,80 +179,72 @@ class HippocampusClient:
         params: dict[str, Any] = {"query": query}
         if limit:
             params["limit"] = limit
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        try:
+            resp = await self._client.get(
+                f"{self.hippo_url}/memories/{user_id}",
+                params=params,
+                headers=self._headers(),
+            )
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            results = data.get("memories", [])
+        except Exception as exc:
+            LOGGER.error("Hippocampus query failed: %s", exc)
+            results = []
+
+        # Fallback: if empty or no substring matches, try without query to list recent items and filter locally
+        if not results:
             try:
-                resp = await client.get(
+                resp2 = await self._client.get(
                     f"{self.hippo_url}/memories/{user_id}",
-                    params=params,
+                    params={"limit": limit or 50},
                     headers=self._headers(),
                 )
-                resp.raise_for_status()
-                data = resp.json()
-                results = data.get("memories", [])
-            except Exception as exc:
-                LOGGER.error("Hippocampus query failed: %s", exc)
-                results = []
-
-            # Fallback: if empty or no substring matches, try without query to list recent items and filter locally
-            if not results:
-                try:
-                    resp2 = await client.get(
-                        f"{self.hippo_url}/memories/{user_id}",
-                        params={"limit": limit or 50},
-                        headers=self._headers(),
-                    )
-                    resp2.raise_for_status()
-                    data2 = resp2.json()
-                    results = data2.get("memories", [])
-                except Exception as exc2:
-                    LOGGER.error("Hippocampus fallback list failed: %s", exc2)
-                    return []
+                resp2.raise_for_status()
+                data2 = orjson.loads(resp2.content)
+                results = data2.get("memories", [])
+            except Exception as exc2:
+                LOGGER.error("Hippocampus fallback list failed: %s", exc2)
+                return []
 
         # Fallback substring filter (case-insensitive) and simple recency weighting if timestamps present
         q = query.lower()
+        tokens = _WORD_RE.findall(q)
         matched: list[dict[str, Any]] = []
-        now = None
-        import re
-
-        tokens = [tok for tok in re.findall(r"\w+", q) if tok]
+        or_matched: list[dict[str, Any]] = []
+        # Lower text and keywords once per candidate; the substring, AND, and
+        # OR checks all run in one pass over the precomputed fields, with a
+        # frozenset for O(1) token membership.
         for mem in results:
             text = (mem.get("text") or mem.get("memory") or "").lower()
             keywords = (mem.get("metadata", {}) or {}).get("keywords") or []
             kw_lower = [str(k).lower() for k in keywords]
-            text_hits = q in text
-            kw_hits = q in " ".join(kw_lower)
-            if text_hits or kw_hits:
+            kw_set = frozenset(kw_lower)
+            if q in text or q in " ".join(kw_lower):
                 matched.append(mem)
                 continue
             # all tokens must appear (AND)
-            if tokens and all(tok in text or tok in kw_lower for tok in tokens):
+            if tokens and all(tok in text or tok in kw_set for tok in tokens):
                 matched.append(mem)
                 continue
+            if tokens and any(tok in text or tok in kw_set for tok in tokens):
+                or_matched.append(mem)
         # If no AND match, fall back to OR matching
-        if not matched and tokens:
-            for mem in results:
-                text = (mem.get("text") or mem.get("memory") or "").lower()
-                keywords = (mem.get("metadata", {}) or {}).get("keywords") or []
-                kw_lower = [str(k).lower() for k in keywords]
-                if any(tok in text or tok in kw_lower for tok in tokens):
-                    matched.append(mem)
+        if not matched:
+            matched = or_matched
 
         if matched:
-            def _score(mem: dict[str, Any]) -> float:
-                meta = mem.get("metadata", {}) or {}
-                ts = meta.get("timestamp")
-                try:
-                    ts_val = float(ts)
-                    nonlocal now
-                    if now is None:
-                        import time as _t
-                        now = _t.time()
-                    age_days = max(0.0, (now - ts_val) / 86400.0)
-                    recency = max(0.0, 1.0 - age_days / 30.0)
-                except Exception:
-                    recency = 0.3
-                return recency
-            matched = sorted(matched, key=_score, reverse=True)
-            return matched[:limit] if limit else matched
+            now = time.time()
+            # Decorate with (score, -position) so ranking compares plain
+            # tuples — no per-item key callback — while ties keep their
+            # original order.
+            decorated = [
+                (_recency_score(mem, now), -position, mem)
+                for position, mem in enumerate(matched)
+            ]
+            if limit:
+                return [mem for _, _, mem in heapq.nlargest(limit, decorated)]
+            decorated.sort(reverse=True)
+            return [mem for _, _, mem in decorated]
 
         return results[: (limit or len(results))]
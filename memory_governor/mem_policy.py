@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import re
+from functools import lru_cache
 from typing import Any
 
 import math
@@ -15,24 +16,32 @@ from memory_governor.schemas import (
 )
 
 
-def _keyword_score(text: str) -> float:
-    text_l = text.lower()
-    keywords = [
-        "remember",
-        "note",
-        "important",
-        "prefer",
-        "always",
-        "never",
-        "please",
-        "do not",
-        "don't",
-        "todo",
-        "task",
-        "tomorrow",
-        "next week",
-    ]
-    hits = sum(1 for kw in keywords if kw in text_l)
+# Compiled once: the observe path runs these on every ingested event, and
+# going through re's module-level cache costs a dict probe plus flag parsing
+# per call.
+_WS_RE = re.compile(r"\s+")
+_COMMIT_RE = re.compile(r"\b(always|never|prefer|i will|i'll|please remember)\b")
+_KW_RE = re.compile(
+    r"remember|note|important|prefer|always|never|please|do not|don't|todo|task|tomorrow|next week"
+)
+# Plain-substring forms of the commitment phrases: an `in` check over these is
+# far cheaper than the word-boundary regex, which only runs to confirm a hit.
+_SHORT_KEYS = ("always", "never", "prefer", "i will", "i'll", "please remember")
+
+# Consolidation keyword families compiled into one IGNORECASE alternation
+# each: matching the original text directly avoids allocating a lowercased
+# copy of every event. Strong semantic cues also set the higher confidence.
+_SEMANTIC_STRONG_RE = re.compile(r"prefer|always|never", re.IGNORECASE)
+_SEMANTIC_WEAK_RE = re.compile(r"like|please remember|compose|plugin", re.IGNORECASE)
+_RUNBOOK_RE = re.compile(r"runbook", re.IGNORECASE)
+_PROC_RE = re.compile(r"^(?:run|use|start|stop|runbook|task|todo)|restart", re.IGNORECASE)
+
+
+def _keyword_score(lowered: str) -> float:
+    # One C-level alternation scan instead of thirteen substring passes over
+    # the text; counting distinct matched keywords keeps the old
+    # presence-based scoring. Callers pass already-lowercased text.
+    hits = len(set(_KW_RE.findall(lowered)))
     return min(1.0, 0.15 * hits)
 
 
@@ -90,22 +99,30 @@ LOW_SALIENCE_SOURCES: dict[str, float] = {
 }
 
 
-def classify_observation(event: ObserveRequest) -> tuple[float, str]:
-    """Return salience and decision kind."""
-
-    text = event.text.strip()
+@lru_cache(maxsize=4096)
+def _score_text(text: str, explicit: bool) -> float:
+    """Pure salience score for a stripped text; cached since observation
+    streams repeat boilerplate (retries, acks, templated dumps)."""
+    lowered = text.lower()
     base = 0.1 + min(0.5, len(text) / 4000.0)
-    base += _keyword_score(text)
+    base += _keyword_score(lowered)
 
     # Boost for explicit markers or commands
-    if text.lower().startswith(("!remember", "!recall")) or event.metadata.get("reason") == "explicit":
+    if explicit or lowered.startswith(("!remember", "!recall")):
         base = max(base, 0.9)
 
-    # Preferential/commitment phrases boost
-    if re.search(r"\b(always|never|prefer|i will|i'll|please remember)\b", text, re.IGNORECASE):
+    # Preferential/commitment phrases boost; plain substring check first so
+    # the word-boundary regex only runs on likely hits
+    if any(k in lowered for k in _SHORT_KEYS) and _COMMIT_RE.search(lowered):
         base = max(base, 0.6)
 
-    salience = min(1.0, base)
+    return min(1.0, base)
+
+
+def classify_observation(event: ObserveRequest) -> tuple[float, str]:
+    """Return salience and decision kind."""
+
+    salience = _score_text(event.text.strip(), event.metadata.get("reason") == "explicit")
     cap = LOW_SALIENCE_SOURCES.get(event.source)
     if cap is not None:
         salience = min(salience, cap)
@@ -118,27 +135,62 @@ def classify_observation(event: ObserveRequest) -> tuple[float, str]:
     return salience, kind
 
 
+@lru_cache(maxsize=4096)
 def canonicalize_memory(text: str) -> str:
     # Strip whitespace, collapse spaces, keep short factual statement.
-    cleaned = re.sub(r"\s+", " ", text).strip()
+    # Pure string-in/string-out, so repeated texts (templated reminders,
+    # forwarded notifications) skip the regex pass entirely.
+    cleaned = _WS_RE.sub(" ", text).strip()
     return cleaned[:500]
 
 
 def consolidate_events(
     events: list[dict[str, Any]],
     mode: str = "all",
-) -> dict[str, list[dict[str, Any]]]:
-    """Produce simple extractions for episodic/semantic/procedural."""
+) -> tuple[dict[str, list[dict[str, Any]]], int]:
+    """Produce simple extractions for episodic/semantic/procedural.
+
+    Returns the grouped extractions plus the newest event timestamp, tracked
+    during the same pass so callers don't rescan the batch for it.
+    """
 
     episodic: list[dict[str, Any]] = []
     semantic: list[dict[str, Any]] = []
     procedural: list[dict[str, Any]] = []
+    newest_ts = 0
+
+    # Mode flags computed once rather than via `mode in (...)` per event.
+    mode_all = mode == "all"
+    ep_on = mode_all or mode == "episodic"
+    sem_on = mode_all or mode == "semantic"
+    proc_on = mode_all or mode == "procedural"
 
     for evt in events:
         text = evt.get("text", "")
+        ts = evt.get("timestamp", 0)
+        if ts and ts > newest_ts:
+            newest_ts = ts
+
+        # Decide what fires before allocating anything: in semantic- or
+        # procedural-only mode most events produce no output, so the
+        # provenance dict would be wasted work.
+        sem_hit = strong = False
+        if sem_on:
+            # One pass decides both the match and the confidence: a strong cue
+            # is also a weak match, so the weak scan only runs when needed.
+            strong = _SEMANTIC_STRONG_RE.search(text) is not None
+            sem_hit = strong or _SEMANTIC_WEAK_RE.search(text) is not None
+        proc_hit = has_runbook = False
+        if proc_on:
+            has_runbook = _RUNBOOK_RE.search(text) is not None
+            proc_hit = has_runbook or _PROC_RE.search(text) is not None
+        if not (ep_on or sem_hit or proc_hit):
+            continue
+
         meta = evt.get("metadata") or {}
         tier = meta.get("tier") or "safe"
-
+        # Shared by reference across the output records; consumers treat the
+        # extractions as read-only.
         provenance = {
             "source": evt.get("source"),
             "event_id": evt.get("event_id"),
@@ -147,9 +199,8 @@ def consolidate_events(
             "timestamp": evt.get("timestamp"),
             "tier": tier,
         }
-        lower = text.lower()
 
-        if mode in ("all", "episodic"):
+        if ep_on:
             episodic.append(
                 {
                     "text": text,
@@ -159,34 +210,35 @@ def consolidate_events(
                     "provenance": provenance,
                 }
             )
-        if mode in ("all", "semantic"):
-            if any(tok in lower for tok in ["prefer", "always", "never", "like", "please remember", "compose", "plugin"]):
-                semantic.append(
-                    {
-                        "text": canonicalize_memory(text),
-                        "kind": "semantic",
-                        "confidence": 0.7 if any(tok in lower for tok in ["prefer", "always", "never"]) else 0.6,
-                        "tier": tier,
-                        "provenance": provenance,
-                    }
-                )
-        if mode in ("all", "procedural"):
-            if any(lower.startswith(tok) for tok in ("run", "use", "start", "stop", "runbook", "task", "todo")) or "runbook" in lower or "restart" in lower:
-                procedural.append(
-                    {
-                        "text": canonicalize_memory(text),
-                        "kind": "procedural",
-                        "confidence": 0.65 if "runbook" in lower else 0.55,
-                        "tier": tier,
-                        "provenance": provenance,
-                    }
-                )
-
-    return {
-        "episodic": episodic,
-        "semantic": semantic,
-        "procedural": procedural,
-    }
+        if sem_hit:
+            semantic.append(
+                {
+                    "text": canonicalize_memory(text),
+                    "kind": "semantic",
+                    "confidence": 0.7 if strong else 0.6,
+                    "tier": tier,
+                    "provenance": provenance,
+                }
+            )
+        if proc_hit:
+            procedural.append(
+                {
+                    "text": canonicalize_memory(text),
+                    "kind": "procedural",
+                    "confidence": 0.65 if has_runbook else 0.55,
+                    "tier": tier,
+                    "provenance": provenance,
+                }
+            )
+
+    return (
+        {
+            "episodic": episodic,
+            "semantic": semantic,
+            "procedural": procedural,
+        },
+        newest_ts,
+    )
 
 
 SCORE_WEIGHTS = ScoreSignals(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
@@ -22,6 +23,20 @@ class ObserveRequest(BaseModel):
     scope: Scope
     metadata: dict[str, Any] = Field(default_factory=dict)
 
+    @cached_property
+    def normalized(self) -> str:
+        """Canonicalized, lowercased text, computed once per event lifetime.
+
+        The observe pipeline normalizes the same text in several places
+        (dedupe hashing, consolidation); caching on the request avoids the
+        repeated regex substitution. Computed lazily so events that are
+        dropped early never pay for it.
+        """
+        # Imported here: mem_policy imports this module at top level.
+        from memory_governor.mem_policy import canonicalize_memory  # noqa: PLC0415
+
+        return canonicalize_memory(self.text).lower()
+
 
 class ObserveDecision(BaseModel):
     salience: float
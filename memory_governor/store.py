@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import os
 import sqlite3
+import threading
 import time
 import uuid
 from pathlib import Path
 from typing import Any
 
-from memory_governor.mem_policy import canonicalize_memory
+import orjson
+
 from memory_governor.schemas import ObserveRequest, Scope
 from memory_governor.scopes import scope_path
 
@@ -25,6 +28,33 @@ def _scope_key(scope: Scope) -> str:
     return f"{scope.kind}:{scope.id}"
 
 
+class _LazyMetadataRow(dict):
+    """Working-event row that defers the metadata JSON decode.
+
+    Most recent_for_scope consumers only touch text/timestamp, so the decode
+    runs on first metadata access instead of once per returned row.
+    """
+
+    __slots__ = ("_raw_metadata",)
+
+    def __init__(self, row: dict[str, Any], raw_metadata: bytes | str | None) -> None:
+        super().__init__(row)
+        self._raw_metadata = raw_metadata
+
+    def __missing__(self, key: str) -> Any:
+        if key == "metadata":
+            value = orjson.loads(self._raw_metadata) if self._raw_metadata else {}
+            self["metadata"] = value
+            return value
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # dict.get bypasses __missing__, so route metadata through it.
+        if key == "metadata" and "metadata" not in self:
+            return self["metadata"]
+        return super().get(key, default)
+
+
 class WorkingStore:
     """SQLite-backed working/stream memory store with dedupe."""
 
@@ -32,10 +62,23 @@ class WorkingStore:
         self.db_path = db_path
         self.ttl_hours = ttl_hours
         db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One long-lived connection: per-call sqlite3.connect() re-parsed the
+        # schema and re-opened the file on every recall bump. autocommit
+        # (isolation_level=None) keeps single statements from holding an
+        # implicit transaction open, and the lock serializes access since the
+        # connection is shared across request threads.
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
         self._init_db()
 
     def _init_db(self) -> None:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS working_events (
@@ -66,15 +109,28 @@ class WorkingStore:
                 );
                 """
             )
-            conn.commit()
             # Ensure normalized_text exists (SQLite add column is idempotent)
             try:
                 conn.execute("ALTER TABLE working_events ADD COLUMN normalized_text TEXT")
             except sqlite3.OperationalError:
                 pass
 
+            # Fixed-size dedupe key: a 16-byte hash of the normalized text plus
+            # a day bucket, deduped atomically via INSERT OR IGNORE against the
+            # unique index below. Replaces the old (user_id, normalized_text, ts)
+            # index, which walked variable-length TEXT keys on every observe.
+            for ddl in (
+                "ALTER TABLE working_events ADD COLUMN norm_hash BLOB",
+                "ALTER TABLE working_events ADD COLUMN ts_day INTEGER",
+            ):
+                try:
+                    conn.execute(ddl)
+                except sqlite3.OperationalError:
+                    pass
+            conn.execute("DROP INDEX IF EXISTS idx_working_norm")
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_working_norm ON working_events(user_id, normalized_text, ts)"
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_working_dedupe "
+                "ON working_events(user_id, norm_hash, ts_day)"
             )
 
             try:
@@ -151,17 +207,17 @@ class WorkingStore:
     @staticmethod
     def _append_capped(json_arr: str, value: str, cap: int) -> str:
         try:
-            arr = json.loads(json_arr or "[]")
+            arr = orjson.loads(json_arr or "[]")
             if not isinstance(arr, list):
                 arr = []
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             arr = []
         if value in arr:
-            return json.dumps(arr)
+            return orjson.dumps(arr).decode()
         arr.append(value)
         if len(arr) > cap:
             arr = arr[-cap:]
-        return json.dumps(arr)
+        return orjson.dumps(arr).decode()
 
     def bump_recall(
         self,
@@ -180,7 +236,8 @@ class WorkingStore:
             return
         ts = int(now_ts or time.time())
         day = time.strftime("%Y-%m-%d", time.gmtime(ts))
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
             conn.execute(
                 """
                 INSERT INTO recall_stats(
@@ -197,8 +254,8 @@ class WorkingStore:
                     memory_id,
                     ts,
                     float(rerank_score or 0.0),
-                    json.dumps([query_hash] if query_hash else []),
-                    json.dumps([day]),
+                    orjson.dumps([query_hash] if query_hash else []).decode(),
+                    orjson.dumps([day]).decode(),
                 ),
             )
             # The ON CONFLICT path above can't cap-append JSON arrays in SQL,
@@ -218,11 +275,10 @@ class WorkingStore:
                     "UPDATE recall_stats SET query_hashes=?, recall_days=? WHERE memory_id=?",
                     (new_hashes, new_days, memory_id),
                 )
-            conn.commit()
 
     def get_recall_stats(self, memory_id: str) -> dict[str, Any] | None:
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 "SELECT memory_id, last_recalled_at, recall_count, "
                 "sum_relevance, query_hashes, recall_days "
                 "FROM recall_stats WHERE memory_id=?",
@@ -231,12 +287,12 @@ class WorkingStore:
         if not row:
             return None
         try:
-            hashes = json.loads(row[4] or "[]")
-        except json.JSONDecodeError:
+            hashes = orjson.loads(row[4] or "[]")
+        except orjson.JSONDecodeError:
             hashes = []
         try:
-            days = json.loads(row[5] or "[]")
-        except json.JSONDecodeError:
+            days = orjson.loads(row[5] or "[]")
+        except orjson.JSONDecodeError:
             days = []
         recall_count = row[2] or 0
         sum_relevance = row[3] or 0.0
@@ -258,8 +314,8 @@ class WorkingStore:
         """
         if limit <= 0:
             return []
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        with self._lock:
+            rows = self._conn.execute(
                 "SELECT memory_id, recall_count, last_recalled_at "
                 "FROM recall_stats ORDER BY recall_count DESC, last_recalled_at DESC "
                 "LIMIT ?",
@@ -275,8 +331,8 @@ class WorkingStore:
         if not memory_ids:
             return {}
         placeholders = ",".join("?" * len(memory_ids))
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        with self._lock:
+            rows = self._conn.execute(
                 f"SELECT memory_id, recall_count FROM recall_stats WHERE memory_id IN ({placeholders})",
                 tuple(memory_ids),
             ).fetchall()
@@ -293,9 +349,9 @@ class WorkingStore:
         if not memory_id:
             return
         ts = int(now_ts or time.time())
-        signals_json = json.dumps(signals or {})
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        signals_json = orjson.dumps(signals or {}).decode()
+        with self._lock:
+            self._conn.execute(
                 """
                 INSERT INTO dream_promotions(
                     memory_id, last_dreamed_at, dream_count, last_score, last_signals
@@ -309,11 +365,10 @@ class WorkingStore:
                 """,
                 (memory_id, ts, float(score), signals_json),
             )
-            conn.commit()
 
     def get_dream_promotion(self, memory_id: str) -> dict[str, Any] | None:
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 "SELECT memory_id, last_dreamed_at, dream_count, last_score, last_signals "
                 "FROM dream_promotions WHERE memory_id=?",
                 (memory_id,),
@@ -321,8 +376,8 @@ class WorkingStore:
         if not row:
             return None
         try:
-            signals = json.loads(row[4] or "{}")
-        except json.JSONDecodeError:
+            signals = orjson.loads(row[4] or "{}")
+        except orjson.JSONDecodeError:
             signals = {}
         return {
             "memory_id": row[0],
@@ -337,8 +392,8 @@ class WorkingStore:
         if not memory_ids:
             return {}
         placeholders = ",".join("?" * len(memory_ids))
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        with self._lock:
+            rows = self._conn.execute(
                 f"SELECT memory_id, last_dreamed_at, dream_count, last_score "
                 f"FROM dream_promotions WHERE memory_id IN ({placeholders})",
                 tuple(memory_ids),
@@ -354,8 +409,8 @@ class WorkingStore:
 
     def dreamed_within(self, since_ts: int) -> list[str]:
         """Memory IDs with last_dreamed_at >= since_ts. Used by prune protection."""
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        with self._lock:
+            rows = self._conn.execute(
                 "SELECT memory_id FROM dream_promotions WHERE last_dreamed_at >= ? "
                 "ORDER BY last_dreamed_at DESC",
                 (int(since_ts),),
@@ -364,8 +419,8 @@ class WorkingStore:
 
     def recently_recalled_ids(self, since_ts: int) -> list[str]:
         """Memory IDs with last_recalled_at >= since_ts. Used by prune to skip hot memories."""
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        with self._lock:
+            rows = self._conn.execute(
                 "SELECT memory_id FROM recall_stats WHERE last_recalled_at >= ? ORDER BY last_recalled_at DESC",
                 (int(since_ts),),
             ).fetchall()
@@ -394,7 +449,7 @@ class WorkingStore:
             "stale": row[3],
             "last_outcome": row[4],
             "last_outcome_ts": row[5],
-            "history": json.loads(row[6] or "[]"),
+            "history": orjson.loads(row[6] or "[]"),
         }
 
     def apply_outcome(
@@ -410,7 +465,8 @@ class WorkingStore:
         if outcome not in {"good", "bad", "stale"}:
             raise ValueError(f"unknown outcome: {outcome!r}")
         ts = int(now_ts or time.time())
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
             current = self._outcome_row(conn, memory_id)
             confidence_before = _clamp_confidence(base_confidence + current["confidence_delta"])
 
@@ -458,10 +514,9 @@ class WorkingStore:
                 """,
                 (
                     memory_id, new_conf_delta, new_sal_delta, disputed, stale,
-                    outcome, ts, json.dumps(history),
+                    outcome, ts, orjson.dumps(history).decode(),
                 ),
             )
-            conn.commit()
 
         return {
             "confidence_before": confidence_before,
@@ -478,8 +533,8 @@ class WorkingStore:
         }
 
     def get_outcome(self, memory_id: str) -> dict[str, Any] | None:
-        with sqlite3.connect(self.db_path) as conn:
-            row = self._outcome_row(conn, memory_id)
+        with self._lock:
+            row = self._outcome_row(self._conn, memory_id)
         if row["last_outcome"] is None and row["confidence_delta"] == 0.0 and row["salience_delta"] == 0.0:
             return None
         return row
@@ -488,8 +543,8 @@ class WorkingStore:
         if not memory_ids:
             return {}
         placeholders = ",".join("?" * len(memory_ids))
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        with self._lock:
+            rows = self._conn.execute(
                 f"SELECT memory_id, confidence_delta, salience_delta, disputed, stale, last_outcome, last_outcome_ts "
                 f"FROM memory_outcomes WHERE memory_id IN ({placeholders})",
                 tuple(memory_ids),
@@ -507,80 +562,92 @@ class WorkingStore:
         }
 
     def stale_ids(self) -> set[str]:
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        with self._lock:
+            rows = self._conn.execute(
                 "SELECT memory_id FROM memory_outcomes WHERE stale=1"
             ).fetchall()
         return {row[0] for row in rows}
 
     def recent_outcome_ids(self, since_ts: int) -> set[str]:
-        with sqlite3.connect(self.db_path) as conn:
-            rows = conn.execute(
+        with self._lock:
+            rows = self._conn.execute(
                 "SELECT memory_id FROM memory_outcomes WHERE last_outcome_ts >= ?",
                 (int(since_ts),),
             ).fetchall()
         return {row[0] for row in rows}
 
+    _INSERT_WORKING_SQL = """
+        INSERT OR IGNORE INTO working_events (
+            source, user_id, text, normalized_text, norm_hash, ts, ts_day,
+            scope_key, scope_kind, scope_id, event_id, metadata, scope_path
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _event_row(event: ObserveRequest) -> tuple[Any, ...]:
+        ts = int(event.timestamp or time.time())
+        normalized = event.normalized
+        return (
+            event.source,
+            event.user_id,
+            event.text,
+            normalized,
+            hashlib.blake2b(normalized.encode(), digest_size=16).digest(),
+            ts,
+            ts // 86400,
+            _scope_key(event.scope),
+            event.scope.kind,
+            event.scope.id,
+            event.metadata.get("event_id"),
+            # Raw orjson bytes (SQLite keeps them as a BLOB); readers decode
+            # lazily via _LazyMetadataRow.
+            orjson.dumps(event.metadata or {}),
+            scope_path(event.scope),
+        )
+
     def add_working(self, event: ObserveRequest) -> bool:
         """Returns True if inserted, False if deduped."""
-        scope_key = _scope_key(event.scope)
-        spath = scope_path(event.scope)
-        metadata_json = json.dumps(event.metadata or {})
-        ts = int(event.timestamp or time.time())
-        normalized = canonicalize_memory(event.text).lower()
-        dedupe_cutoff = ts - 24 * 3600
-        with sqlite3.connect(self.db_path) as conn:
-            if event.metadata.get("event_id"):
-                existing = conn.execute(
-                    "SELECT 1 FROM working_events WHERE source=? AND event_id=? LIMIT 1",
-                    (event.source, event.metadata["event_id"]),
-                ).fetchone()
-                if existing:
-                    return False
-            # Dedupe on normalized text for same user within last 24h
-            existing_norm = conn.execute(
-                """
-                SELECT 1 FROM working_events
-                WHERE user_id=? AND normalized_text=? AND ts>=?
-                LIMIT 1
-                """,
-                (event.user_id, normalized, dedupe_cutoff),
-            ).fetchone()
-            if existing_norm:
-                return False
-            conn.execute(
-                """
-                INSERT INTO working_events (source, user_id, text, normalized_text, ts, scope_key, scope_kind, scope_id, event_id, metadata, scope_path)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    event.source,
-                    event.user_id,
-                    event.text,
-                    normalized,
-                    ts,
-                    scope_key,
-                    event.scope.kind,
-                    event.scope.id,
-                    event.metadata.get("event_id"),
-                    metadata_json,
-                    spath,
-                ),
-            )
-            conn.commit()
-        return True
+        # One atomic probe instead of two read-before-write SELECTs: OR IGNORE
+        # bounces off either unique index (source/event_id, or the
+        # user/norm_hash/day dedupe key) and rowcount reports the outcome.
+        row = self._event_row(event)
+        with self._lock:
+            cur = self._conn.execute(self._INSERT_WORKING_SQL, row)
+        return cur.rowcount > 0
+
+    def add_working_many(self, events: list[ObserveRequest]) -> int:
+        """Bulk insert in a single transaction. Returns the inserted count.
+
+        Row tuples are precomputed outside the lock, then one executemany
+        runs under BEGIN IMMEDIATE so a replay burst pays a single
+        commit/fsync instead of one per event. Dedupe works the same as
+        add_working: OR IGNORE against the unique indexes.
+        """
+        if not events:
+            return 0
+        rows = [self._event_row(event) for event in events]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cur = self._conn.executemany(self._INSERT_WORKING_SQL, rows)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return cur.rowcount
 
     def cleanup(self) -> None:
         cutoff = int(time.time() - self.ttl_hours * 3600)
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("DELETE FROM working_events WHERE ts < ?", (cutoff,))
-            conn.commit()
+        with self._lock:
+            self._conn.execute("DELETE FROM working_events WHERE ts < ?", (cutoff,))
 
     def recent_for_scope(
         self, scope: Scope, limit: int = 100, include_ancestors: bool = False
     ) -> list[dict[str, Any]]:
         spath = scope_path(scope)
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
             if include_ancestors:
                 from memory_governor.scopes import ancestor_paths
                 paths = ancestor_paths(spath)
@@ -610,22 +677,25 @@ class WorkingStore:
         results = []
         for row in rows:
             results.append(
-                {
-                    "id": row[0],
-                    "source": row[1],
-                    "user_id": row[2],
-                    "text": row[3],
-                    "timestamp": row[4],
-                    "scope_kind": row[5],
-                    "scope_id": row[6],
-                    "event_id": row[7],
-                    "metadata": json.loads(row[8] or "{}"),
-                }
+                _LazyMetadataRow(
+                    {
+                        "id": row[0],
+                        "source": row[1],
+                        "user_id": row[2],
+                        "text": row[3],
+                        "timestamp": row[4],
+                        "scope_kind": row[5],
+                        "scope_id": row[6],
+                        "event_id": row[7],
+                    },
+                    row[8],
+                )
             )
         return results
 
     def distinct_scopes(self, prefix: str | None = None, limit: int = 200) -> list[dict[str, Any]]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._conn
             if prefix:
                 rows = conn.execute(
                     """
@@ -658,20 +728,19 @@ class WorkingStore:
 
     def mark_consolidated(self, scope: Scope, up_to_ts: int) -> None:
         scope_key = _scope_key(scope)
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self._lock:
+            self._conn.execute(
                 """
                 INSERT INTO consolidation_state(scope_key, last_ts) VALUES(?, ?)
                 ON CONFLICT(scope_key) DO UPDATE SET last_ts=excluded.last_ts
                 """,
                 (scope_key, up_to_ts),
             )
-            conn.commit()
 
     def consolidated_cursor(self, scope: Scope) -> int | None:
         scope_key = _scope_key(scope)
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 "SELECT last_ts FROM consolidation_state WHERE scope_key=?", (scope_key,)
             ).fetchone()
             return row[0] if row else None
@@ -686,53 +755,111 @@ class StreamLog:
     def append(self, record: dict[str, Any]) -> None:
         ts = int(record.get("timestamp") or time.time())
         record["timestamp"] = ts
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        # Binary append: orjson emits bytes, so writing them directly skips a
+        # str round-trip per record.
+        with self.path.open("ab") as f:
+            f.write(orjson.dumps(record) + b"\n")
 
     def cleanup(self) -> None:
         if not self.path.exists():
             return
         cutoff = int(time.time() - self.ttl_days * 86400)
-        lines = self.path.read_text(encoding="utf-8").splitlines()
-        kept: list[str] = []
-        for line in lines:
-            try:
-                obj = json.loads(line)
-                if int(obj.get("timestamp", 0)) >= cutoff:
-                    kept.append(line)
-            except Exception:
-                continue
-        self.path.write_text("\n".join(kept) + ("\n" if kept else ""), encoding="utf-8")
+        # Stream line-by-line into a sibling tempfile and swap it in, rather
+        # than loading the whole log into memory and rewriting it: peak memory
+        # stays O(1) regardless of log size and the replace is atomic.
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with self.path.open("rb") as src, tmp_path.open("wb") as dst:
+            for line in src:
+                try:
+                    obj = orjson.loads(line)
+                    if int(obj.get("timestamp", 0)) >= cutoff:
+                        dst.write(line if line.endswith(b"\n") else line + b"\n")
+                except Exception:
+                    continue
+        os.replace(tmp_path, self.path)
 
 
 class DurableQueue:
-    """In-process queue with JSONL spool."""
+    """In-process queue with an append-only JSONL spool.
+
+    Completions are tombstones appended to a sibling `.done` file rather than
+    spool rewrites, so both enqueue and mark_done write O(1) bytes instead of
+    rewriting the whole backlog. The spool is compacted once the tombstones
+    outnumber the live jobs.
+    """
 
-    def __init__(self, spool_path: Path) -> None:
+    def __init__(self, spool_path: Path, fsync: bool = False) -> None:
         self.spool_path = spool_path
+        self.done_path = spool_path.with_suffix(spool_path.suffix + ".done")
+        self.fsync = fsync
         spool_path.parent.mkdir(parents=True, exist_ok=True)
         self.backlog: list[dict[str, Any]] = []
+        self._durable: set[str] = set()
+        self._done_count = 0
         self._load()
+        self._f = self.spool_path.open("ab")
+        self._done_f = self.done_path.open("ab")
 
     def _load(self) -> None:
+        done: set[str] = set()
+        if self.done_path.exists():
+            for line in self.done_path.read_bytes().splitlines():
+                try:
+                    done.add(orjson.loads(line)["done"])
+                except Exception:
+                    continue
+        self._done_count = len(done)
         if not self.spool_path.exists():
             return
-        for line in self.spool_path.read_text(encoding="utf-8").splitlines():
+        for line in self.spool_path.read_bytes().splitlines():
             if not line.strip():
                 continue
             try:
-                self.backlog.append(json.loads(line))
+                job = orjson.loads(line)
             except Exception:
                 continue
+            self._durable.add(job.get("id"))
+            if job.get("id") not in done:
+                self.backlog.append(job)
+
+    def _append(self, f: Any, item: dict[str, Any]) -> None:
+        f.write(orjson.dumps(item) + b"\n")
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+
+    def compact(self) -> None:
+        """Rewrite the spool to just the live backlog and drop the tombstones."""
+        self._f.close()
+        self._done_f.close()
+        self.spool_path.write_bytes(b"".join(orjson.dumps(item) + b"\n" for item in self.backlog))
+        self.done_path.write_bytes(b"")
+        self._durable = {item.get("id") for item in self.backlog}
+        self._done_count = 0
+        self._f = self.spool_path.open("ab")
+        self._done_f = self.done_path.open("ab")
+
+    def make_job(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Build a job envelope without touching the spool.
+
+        Request handlers hand the envelope to the in-memory queue and the
+        worker persists it via persist_jobs() before delivery, keeping disk
+        I/O off the request path.
+        """
+        return {"id": str(uuid.uuid4()), "payload": payload, "ts": int(time.time())}
 
-    def _persist(self) -> None:
-        lines = [json.dumps(item) for item in self.backlog]
-        self.spool_path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+    def persist_jobs(self, jobs: list[dict[str, Any]]) -> None:
+        """Append any not-yet-durable envelopes to the spool."""
+        for job in jobs:
+            if job["id"] in self._durable:
+                continue
+            self.backlog.append(job)
+            self._durable.add(job["id"])
+            self._append(self._f, job)
 
     def enqueue(self, payload: dict[str, Any]) -> dict[str, Any]:
-        job = {"id": str(uuid.uuid4()), "payload": payload, "ts": int(time.time())}
-        self.backlog.append(job)
-        self._persist()
+        job = self.make_job(payload)
+        self.persist_jobs([job])
         return job
 
     def pending(self) -> list[dict[str, Any]]:
@@ -740,4 +867,7 @@ class DurableQueue:
 
     def mark_done(self, job_id: str) -> None:
         self.backlog = [item for item in self.backlog if item.get("id") != job_id]
-        self._persist()
+        self._append(self._done_f, {"done": job_id})
+        self._done_count += 1
+        if self._done_count > len(self.backlog):
+            self.compact()
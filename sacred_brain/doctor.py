@@ -3,10 +3,15 @@ from __future__ import annotations
 import httpx
 
 
-def check_litellm(base_url: str = "http://127.0.0.1:4000") -> dict:
+def check_litellm(base_url: str = "http://127.0.0.1:4000", client: httpx.Client | None = None) -> dict:
+    """Probe the LiteLLM /v1/models endpoint.
+
+    Pass an httpx.Client to reuse its connection pool when polling; otherwise
+    a one-shot request is made.
+    """
     url = f"{base_url.rstrip('/')}/v1/models"
     try:
-        resp = httpx.get(url, timeout=5)
+        resp = client.get(url, timeout=5) if client is not None else httpx.get(url, timeout=5)
         resp.raise_for_status()
         data = resp.json()
         return {"litellm": "ok", "models": [m.get("id") for m in data.get("data", [])]}
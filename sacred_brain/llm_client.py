@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import os
+import random
 import time
 from collections.abc import Iterable
 from dataclasses import dataclass
@@ -43,6 +44,24 @@ class LLMClient:
         self.retries = retries
         self.temperature = temperature
         self.top_p = top_p
+        # One pooled client per LLMClient: module-level httpx.post opened a
+        # fresh TCP (and TLS) connection per call; keep-alive reuse saves that
+        # round-trip on every completion. HTTP/2 is left off because the h2
+        # extra is not a project dependency.
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+    def __enter__(self) -> LLMClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def generate_reply(
         self,
@@ -68,12 +87,15 @@ class LLMClient:
             "temperature": effective_temp,
             "top_p": effective_top_p,
         }
-        url = f"{self.base_url}/v1/chat/completions"
+        # Total retry budget: however many attempts are configured, give up
+        # once the wall-clock allowance for them is spent.
+        deadline = time.monotonic() + self.timeout * (self.retries + 1)
         attempt = 0
         while attempt <= self.retries:
+            retry_after = None
             try:
                 start = time.time()
-                resp = httpx.post(url, json=payload, headers=headers, timeout=self.timeout)
+                resp = self._client.post("/v1/chat/completions", json=payload, headers=headers)
                 resp.raise_for_status()
                 latency = time.time() - start
                 # latency is returned to caller via None; caller logs separately
@@ -89,11 +111,29 @@ class LLMClient:
                     usage.get("total_tokens"),
                 )
                 return _strip_think(data["choices"][0]["message"]["content"])
-            except Exception:
-                attempt += 1
-                if attempt > self.retries:
+            except httpx.HTTPStatusError as exc:
+                status = exc.response.status_code
+                if status < 500:
+                    # Client errors (400/401/422...) won't heal on retry.
+                    LOGGER.warning("llm_request rejected with HTTP %s, not retrying", status)
                     return None
-                time.sleep(0.5)
+                retry_after = exc.response.headers.get("Retry-After")
+            except Exception:
+                pass
+            attempt += 1
+            if attempt > self.retries:
+                return None
+            # Exponential backoff with jitter so concurrent callers don't
+            # retry in lockstep; the upstream's Retry-After wins if longer.
+            delay = min(8.0, 0.25 * (2**attempt)) + random.uniform(0, 0.1)
+            if retry_after:
+                try:
+                    delay = max(delay, float(retry_after))
+                except ValueError:
+                    pass
+            if time.monotonic() + delay > deadline:
+                return None
+            time.sleep(delay)
         return None
 
     def _format_messages(
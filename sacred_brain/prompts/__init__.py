@@ -1,5 +1,19 @@
+from functools import cache
 from pathlib import Path
 
-SYSTEM_PROMPT = (Path(__file__).resolve().parent / "sam_system.txt").read_text(encoding="utf-8")
 
-__all__ = ["SYSTEM_PROMPT"]
+@cache
+def get_system_prompt() -> str:
+    return (Path(__file__).resolve().parent / "sam_system.txt").read_text(encoding="utf-8")
+
+
+def __getattr__(name: str) -> str:
+    # Lazy module attribute: importing the package no longer blocks on the
+    # prompt file read; `from sacred_brain.prompts import SYSTEM_PROMPT`
+    # still works and hits the cached read.
+    if name == "SYSTEM_PROMPT":
+        return get_system_prompt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["SYSTEM_PROMPT", "get_system_prompt"]
@@ -1,16 +1,35 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
+import re
 import time
 from collections.abc import Iterable
 
-from sacred_brain.llm_client import MemoryItem, load_llm_client_from_env
+from sacred_brain.llm_client import LLMClient, MemoryItem, load_llm_client_from_env
 from sacred_brain.routing import determine_route, escalate_route
 
 LOGGER = logging.getLogger(__name__)
 _LAST_ROUTE: dict[str, str] = {}
 REMOTE_ALIASES = {"sam-fast-remote"}
+_WORD_RE = re.compile(r"\S+")
+_SUMMARY_MAX_WORDS = 30
+
+
+@functools.lru_cache(maxsize=1)
+def _get_client() -> LLMClient:
+    # Build once and reuse: constructing a client per reply re-parsed env
+    # vars and threw away the connection pool between calls.
+    return load_llm_client_from_env()
+
+
+def reset_client() -> None:
+    """Drop the cached client so the next call rebuilds from env (tests)."""
+    cached = _get_client.cache_info().currsize and _get_client()
+    _get_client.cache_clear()
+    if cached:
+        cached.close()
 
 
 def _build_memory_items(memories: Iterable[dict], max_items: int) -> list[MemoryItem]:
@@ -25,10 +44,13 @@ def _build_memory_items(memories: Iterable[dict], max_items: int) -> list[Memory
         kind = (meta.get("kind") or "").lower()
         if kind not in {"thread", "preference"} and not meta.get("sticky"):
             continue
-        # simple summary/tagline
+        # simple summary/tagline: slice at the end of the 30th word instead
+        # of split/join, which materialized two lists per long memory
         summary = text
-        if len(summary.split()) > 30:
-            summary = " ".join(summary.split()[:30]) + "…"
+        for i, match in enumerate(_WORD_RE.finditer(text)):
+            if i == _SUMMARY_MAX_WORDS:
+                summary = text[: match.start()].rstrip() + "…"
+                break
         # never include raw blobs beyond short summary
         items.append(MemoryItem(title=meta.get("title") or kind or "memory", summary=summary, last_seen=None))
         if len(items) >= max_items:
@@ -43,7 +65,7 @@ def sam_generate_reply(
     memory_context_max: int | None = None,
     bias_note: str | None = None,
 ) -> str:
-    llm_client = load_llm_client_from_env()
+    llm_client = _get_client()
     max_context = memory_context_max or int(os.environ.get("SAM_MEMORY_CONTEXT_MAX", "3"))
     if not llm_client.enabled:
         return "LLM is not attached yet. I can show stored memories and threads."
@@ -37,6 +37,23 @@ def test_create_and_query_memory():
     assert data["memories"][0]["metadata"]["location"] == "cafe"
 
 
+def test_create_memories_batch():
+    client = build_test_client()
+
+    payload = [
+        {"user_id": "bob", "text": "First batch memory"},
+        {"user_id": "bob", "text": "Second batch memory"},
+    ]
+    resp = client.post("/memories/batch", json=payload)
+    assert resp.status_code == 200, resp.text
+    memories = resp.json()["memories"]
+    assert len(memories) == 2
+    assert all(memory["id"] for memory in memories)
+
+    query = client.get("/memories/bob", params={"query": "batch"})
+    assert len(query.json()["memories"]) == 2
+
+
 def test_summarize_endpoint():
     client = build_test_client()
     resp = client.post("/summaries", json={"texts": ["one", "two"]})
@@ -0,0 +1,26 @@
+from brain.hippocampus.llm_cache import SemanticCache
+
+_BODY = (
+    "Could you walk me through how the docker compose deployment is wired "
+    "together for the hippocampus service and what the governor expects?"
+)
+
+
+def test_fuzzy_hit_within_same_scope():
+    cache = SemanticCache()
+    cache.put((_BODY,), "alice reply", scope="matrix:alice")
+    # Near-duplicate prompt (one extra token) from the same sender hits.
+    assert cache.get((_BODY + " thanks",), scope="matrix:alice") == "alice reply"
+
+
+def test_fuzzy_lookup_never_crosses_scopes():
+    cache = SemanticCache()
+    cache.put((_BODY,), "alice reply", scope="matrix:alice")
+    assert cache.get((_BODY,), scope="matrix:bob") is None
+    assert cache.get((_BODY,)) is None
+
+
+def test_unscoped_entries_still_match_fuzzily():
+    cache = SemanticCache()
+    cache.put((_BODY,), "shared summary")
+    assert cache.get((_BODY + " please",)) == "shared summary"
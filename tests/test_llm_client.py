@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from unittest import mock
 
+import httpx
+
 from sacred_brain.llm_client import LLMClient, MemoryItem, _strip_think, load_llm_client_from_env
 
 
@@ -11,7 +13,7 @@ def test_generate_reply_calls_llm():
     response = {
         "choices": [{"message": {"content": "hi"}}],
     }
-    with mock.patch("httpx.post") as mpost:
+    with mock.patch.object(client._client, "post") as mpost:
         mpost.return_value.json.return_value = response
         mpost.return_value.raise_for_status.return_value = None
         reply = client.generate_reply("hello", mem, "sys")
@@ -27,9 +29,22 @@ def test_generate_reply_disabled():
 
 def test_generate_reply_fallback_on_error():
     client = LLMClient(base_url="http://localhost:4000", model="test-model", enabled=True, retries=0)
-    with mock.patch("httpx.post", side_effect=Exception("boom")):
+    with mock.patch.object(client._client, "post", side_effect=Exception("boom")):
+        reply = client.generate_reply("x", [], "sys")
+    assert reply is None
+
+
+def test_generate_reply_no_retry_on_client_error():
+    client = LLMClient(base_url="http://localhost:4000", model="test-model", enabled=True, retries=3)
+    resp = mock.Mock()
+    resp.status_code = 422
+    resp.headers = {}
+    err = httpx.HTTPStatusError("bad request", request=mock.Mock(), response=resp)
+    with mock.patch.object(client._client, "post") as mpost:
+        mpost.return_value.raise_for_status.side_effect = err
         reply = client.generate_reply("x", [], "sys")
     assert reply is None
+    assert mpost.call_count == 1  # 4xx is not retried
 
 
 def test_strip_think_tags():
@@ -1,8 +1,13 @@
+import asyncio
+import threading
+import time
+
 from brain.hippocampus.mem0_adapter import (
     InMemoryMem0Client,
     Mem0Adapter,
     Mem0RemoteClient,
     SQLiteMem0Client,
+    TieredMem0Client,
 )
 from brain.hippocampus.models import ExperienceCreate
 
@@ -19,6 +24,58 @@ def test_inmemory_add_and_query():
     assert result[0].metadata["mood"] == "happy"
 
 
+def test_bulk_add_experiences_sqlite(tmp_path):
+    client = SQLiteMem0Client(db_path=tmp_path / "memories.sqlite")
+    adapter = Mem0Adapter(client=client)
+    records = adapter.add_experiences(
+        [
+            ExperienceCreate(user_id="alice", text="First batch entry"),
+            ExperienceCreate(user_id="alice", text="Second batch entry"),
+        ]
+    )
+    assert len(records) == 2
+    assert len(adapter.query_memories("alice", "batch")) == 2
+    client.close()
+
+
+def test_metadata_filter_pushdown_inmemory():
+    adapter = Mem0Adapter(client=InMemoryMem0Client())
+    adapter.add_experience(ExperienceCreate(user_id="alice", text="compose thread", metadata={"kind": "thread"}))
+    adapter.add_experience(ExperienceCreate(user_id="alice", text="compose fact", metadata={"kind": "fact"}))
+    adapter.add_experience(ExperienceCreate(user_id="alice", text="compose sticky", metadata={"sticky": True}))
+
+    results = adapter.query_memories(
+        "alice", "compose", metadata_filter=({"kind": "thread"}, {"sticky": True})
+    )
+    assert {r.text for r in results} == {"compose thread", "compose sticky"}
+
+
+def test_metadata_filter_pushdown_sqlite(tmp_path):
+    client = SQLiteMem0Client(db_path=tmp_path / "memories.sqlite")
+    adapter = Mem0Adapter(client=client)
+    adapter.add_experience(ExperienceCreate(user_id="alice", text="compose thread", metadata={"kind": "thread"}))
+    adapter.add_experience(
+        ExperienceCreate(user_id="alice", text="compose secret", metadata={"kind": "thread", "sensitive": True})
+    )
+
+    results = adapter.query_memories(
+        "alice", "compose", metadata_filter={"kind": "thread", "sensitive": False}
+    )
+    assert [r.text for r in results] == ["compose thread"]
+    client.close()
+
+
+def test_sqlite_bulk_insert_survives_query(tmp_path):
+    client = SQLiteMem0Client(db_path=tmp_path / "memories.sqlite")
+    adapter = Mem0Adapter(client=client)
+    records = adapter.add_experiences(
+        [ExperienceCreate(user_id="alice", text=f"Walk {i} in the park") for i in range(1000)]
+    )
+    assert len(records) == 1000
+    assert len(adapter.query_memories("alice", "park")) == 5
+    client.close()
+
+
 def test_summary_falls_back_when_client_has_no_summarize():
     adapter = Mem0Adapter(client=InMemoryMem0Client(max_summary_chars=20))
     summary = adapter.summarize_texts(["one", "two", "three"])
@@ -35,6 +92,46 @@ def test_delete_memory_returns_true_when_removed():
     assert adapter.query_memories("alice", "delete") == []
 
 
+def test_inmemory_delete_heavy_compaction():
+    client = InMemoryMem0Client()
+    adapter = Mem0Adapter(client=client)
+    stored = [
+        adapter.add_experience(ExperienceCreate(user_id="alice", text=f"Entry {i} in the log"))
+        for i in range(500)
+    ]
+
+    for record in stored[::2]:
+        assert adapter.delete_memory(record.id) is True
+    assert adapter.delete_memory(stored[0].id) is False
+
+    # Compaction keeps dead slots below a quarter of the columns and queries
+    # see only survivors.
+    assert len(client.list_memories("alice")) == 250
+    assert len(client._free) * 4 <= len(client._ids)
+    results = client.query_memories("alice", "entry 3 in", limit=5)
+    assert [r["text"] for r in results] == ["Entry 3 in the log"]
+
+
+def test_inmemory_delete_purges_postings_before_slot_reuse():
+    client = InMemoryMem0Client()
+    # Padding keeps the dead-slot ratio below the compaction threshold so the
+    # freed slot is reused rather than compacted away.
+    for i in range(10):
+        client.add_memory("carol", f"padding row {i}")
+    stored = client.add_memory("alice", "hello world")
+    client.delete_memory(stored["id"])
+    client.add_memory("bob", "secret hello diary of bob")
+
+    # The reused slot must not surface under alice's postings.
+    assert client.query_memories("alice", "hello", limit=1) == []
+
+    again = client.add_memory("alice", "hello again")
+    client.delete_memory(again["id"])
+    client.add_memory("alice", "hello twice hello")
+    results = client.query_memories("alice", "hello", limit=3)
+    assert [r["text"] for r in results] == ["hello twice hello"]
+
+
 def test_sqlite_persists_between_clients(tmp_path):
     db_path = tmp_path / "memories.sqlite"
     client = SQLiteMem0Client(db_path=db_path)
@@ -64,6 +161,23 @@ def test_sqlite_delete_prunes_persisted_memory(tmp_path):
     client.close()
 
 
+def test_tiered_client_falls_back_to_cold_after_eviction(tmp_path):
+    client = TieredMem0Client(
+        cold=SQLiteMem0Client(db_path=tmp_path / "memories.sqlite"), hot_per_user=4
+    )
+    adapter = Mem0Adapter(client=client)
+    adapter.add_experiences(
+        [ExperienceCreate(user_id="alice", text=f"Note {i} about the park") for i in range(20)]
+    )
+
+    # "Note 0" has been evicted from the bounded hot tier, so this hit can
+    # only come from the cold SQLite tier.
+    assert not client.hot.query_memories("alice", "note 0")
+    results = adapter.query_memories("alice", "note 0")
+    assert [r.text for r in results] == ["Note 0 about the park"]
+    client.close()
+
+
 class _StubRemoteClient:
     def __init__(self) -> None:
         self.calls: list[str] = []
@@ -182,3 +296,82 @@ def test_mem0_remote_client_wraps_sdk(monkeypatch):
     assert calls["add"]["messages"][0]["content"] == "Remember this"
     assert calls["search"]["top_k"] == 2
     assert calls["delete"]["memory_id"] == "sdk-1"
+
+
+def test_mem0_remote_client_concurrent_search(monkeypatch):
+    state = {"active": 0, "peak": 0}
+    state_lock = threading.Lock()
+
+    class _FakeMemoryClient:
+        def __init__(self, api_key=None, host=None):
+            pass
+
+        def search(self, query, user_id=None, top_k=None, limit=None):
+            with state_lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with state_lock:
+                state["active"] -= 1
+            return {"results": [{"id": f"sdk-{user_id}", "memory": query, "user_id": user_id}]}
+
+    class _FakeModule:
+        MemoryClient = _FakeMemoryClient
+
+    def _fake_import(module_name):
+        if module_name == "mem0":
+            return _FakeModule()
+        raise ModuleNotFoundError(module_name)
+
+    monkeypatch.setattr("brain.hippocampus.mem0_adapter.import_module", _fake_import)
+
+    adapter = Mem0Adapter(client=Mem0RemoteClient(api_key="secret"))
+    queries = [(f"user-{i}", f"query {i}") for i in range(4)]
+    results = asyncio.run(adapter.query_memories_many_async(queries))
+
+    assert len(results) == 4
+    assert all(batch[0].id == f"sdk-user-{i}" for i, batch in enumerate(results))
+    # The searches must have overlapped rather than run back-to-back.
+    assert state["peak"] >= 2
+
+
+def test_mem0_remote_batch_add(monkeypatch):
+    add_calls = []
+
+    class _FakeMemoryClient:
+        def __init__(self, api_key=None, host=None):
+            pass
+
+        def add(self, messages, user_id, metadata=None):
+            add_calls.append({"messages": messages, "user_id": user_id, "metadata": metadata})
+            return {
+                "results": [
+                    {"id": f"sdk-{len(add_calls)}-{i}", "memory": m["content"], "user_id": user_id}
+                    for i, m in enumerate(messages)
+                ]
+            }
+
+    class _FakeModule:
+        MemoryClient = _FakeMemoryClient
+
+    def _fake_import(module_name):
+        if module_name == "mem0":
+            return _FakeModule()
+        raise ModuleNotFoundError(module_name)
+
+    monkeypatch.setattr("brain.hippocampus.mem0_adapter.import_module", _fake_import)
+
+    client = Mem0RemoteClient(api_key="secret")
+    payloads = client.add_memories(
+        [
+            ("alice", "first", None),
+            ("alice", "second", None),
+            ("bob", "third", None),
+        ]
+    )
+
+    # One SDK call per (user, metadata) run, not per memory.
+    assert len(add_calls) == 2
+    assert [m["content"] for m in add_calls[0]["messages"]] == ["first", "second"]
+    assert add_calls[1]["user_id"] == "bob"
+    assert [p["text"] for p in payloads] == ["first", "second", "third"]
@@ -7,7 +7,7 @@ class DummyAdapter:
     def __init__(self, memories):
         self.memories = memories
 
-    def query_memories(self, user_id: str, query: str, limit: int = 3):
+    def query_memories(self, user_id: str, query: str, limit: int = 3, metadata_filter=None):
         return self.memories[:limit]
 
 